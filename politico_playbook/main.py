@@ -5,21 +5,32 @@ Main script for collecting and processing Politico Playbook newsletters from ema
 """
 
 import os
+import json
 import logging
-from datetime import datetime
-from dotenv import load_dotenv
-from email_extractor import connect_to_email, extract_playbook_emails
-from html_formatter import extract_text_from_html
+import hashlib
+import multiprocessing
+import time
+import queue
+import atexit
+from logging.handlers import QueueHandler, QueueListener
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/playbook.log'),
-        logging.StreamHandler()
-    ]
-)
+# Configure logging: records are queued here and written by a listener thread,
+# so file and console I/O never block the processing loop
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler('logs/playbook.log'), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# The queue handler is the root logger's only handler. It interpolates each record's
+# message as it is queued (QueueHandler.prepare), so later changes to the arguments
+# can't alter it; the full line layout and all I/O happen on the listener
+logging.root.setLevel(logging.INFO)
+logging.root.addHandler(QueueHandler(_log_queue))
 logger = logging.getLogger(__name__)
 
 def setup_directories():
@@ -30,7 +41,9 @@ def setup_directories():
 
 def process_email_newsletters():
     """Process newsletters from email inbox."""
-    load_dotenv()
+    # Imported here so the text-only path skips the IMAP client
+    from email_extractor import connect_to_email, extract_playbook_emails
+    
     email_address = os.getenv('EMAIL_ADDRESS', 'politicollector@gmail.com')
     password = os.getenv('EMAIL_PASSWORD', 'ckaczaggrgagpimb')
     
@@ -51,41 +64,147 @@ def process_email_newsletters():
             process_extracted_newsletters()
             
         except Exception as e:
-            logger.error(f"Error during email extraction: {e}")
+            logger.error("Error during email extraction: %s", e)
         finally:
             mail_connection.logout()
             logger.info("Email connection closed")
     else:
         logger.error("Failed to establish email connection")
 
-def process_extracted_newsletters():
-    """Process the extracted newsletter HTML files."""
+# Newsletters between progress lines while extracting text
+PROGRESS_LOG_INTERVAL = 100
+
+# Content digests (with the size and mtime they were taken at) of the
+# newsletters whose text is already in data/text
+PROCESSED_MANIFEST = "data/text/.processed.json"
+
+def _file_digest(path):
+    """SHA-256 hex digest of a file's contents, read in 64 KB blocks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _fingerprint(path, stat, record):
+    """
+    Manifest record for a file: its digest plus the size and mtime it was taken at.
+    
+    A previous record whose size and mtime still match is reused as is, so
+    untouched files are never read; anything else is hashed again.
+    """
+    if isinstance(record, dict) and record.get('size') == stat.st_size and record.get('mtime_ns') == stat.st_mtime_ns:
+        return record
+    return {'digest': _file_digest(path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def _load_manifest(path):
+    """Filename to record mapping from the last run; empty if missing or unreadable."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _extract_newsletter_text(filename, newsletter_dir="data/newsletters", text_dir="data/text"):
+    """Save the text of one newsletter HTML file; returns (filename, error) for the caller to log."""
+    from html_formatter import extract_text_from_html_file
+    
+    try:
+        # Stream the HTML through the parser without building a document tree
+        text_content = extract_text_from_html_file(os.path.join(newsletter_dir, filename))
+        
+        # Save extracted text to dedicated text directory, encoded once and written as bytes
+        text_file = os.path.join(text_dir, filename.replace(".html", ".txt"))
+        with open(text_file, 'wb', buffering=1 << 16) as f:
+            f.write(text_content.encode('utf-8'))
+        
+        return filename, None
+    except Exception as e:
+        return filename, str(e)
+
+def process_extracted_newsletters(workers=None):
+    """
+    Process the extracted newsletter HTML files.
+    
+    Files whose contents are unchanged since the last run are skipped; the rest
+    are parsed across worker processes (defaults to CPU count; 1 runs serially).
+    """
     newsletter_dir = "data/newsletters"
     if not os.path.exists(newsletter_dir):
-        logger.warning(f"Directory {newsletter_dir} does not exist")
+        logger.warning("Directory %s does not exist", newsletter_dir)
         return
     
-    for filename in os.listdir(newsletter_dir):
-        if filename.endswith(".html"):
-            file_path = os.path.join(newsletter_dir, filename)
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-                
-                # Extract text from HTML
-                text_content = extract_text_from_html(html_content)
-                
-                # Save extracted text to dedicated text directory
-                text_file = os.path.join("data/text", filename.replace(".html", ".txt"))
-                with open(text_file, 'w', encoding='utf-8') as f:
-                    f.write(text_content)
-                
-                logger.info(f"Processed {filename}")
-            except Exception as e:
-                logger.error(f"Error processing {filename}: {e}")
+    # scandir's entries carry the file type from the directory read, so only
+    # the HTML files themselves are stat'ed
+    with os.scandir(newsletter_dir) as entries:
+        stats = {entry.name: entry.stat() for entry in entries
+                 if entry.name.endswith(".html") and entry.is_file()}
+    filenames = list(stats)
+    
+    # Fingerprint everything up front: a stat match costs nothing, and hashing
+    # a touched file is still far cheaper than parsing it
+    previous = _load_manifest(PROCESSED_MANIFEST)
+    records = {
+        filename: _fingerprint(os.path.join(newsletter_dir, filename), stats[filename], previous.get(filename))
+        for filename in filenames
+    }
+    manifest = {}
+    pending = []
+    for filename in filenames:
+        record = previous.get(filename)
+        if (isinstance(record, dict) and record.get('digest') == records[filename]['digest']
+                and os.path.exists(os.path.join("data/text", filename.replace(".html", ".txt")))):
+            manifest[filename] = records[filename]
+        else:
+            pending.append(filename)
+    if len(pending) < len(filenames):
+        logger.info("Skipping %d unchanged newsletters", len(filenames) - len(pending))
+    
+    workers = workers or os.cpu_count() or 1
+    
+    pool = None
+    if workers > 1 and len(pending) > 1:
+        pool = multiprocessing.Pool(min(workers, len(pending)))
+        results = pool.imap_unordered(_extract_newsletter_text, pending, chunksize=8)
+    else:
+        results = map(_extract_newsletter_text, pending)
+    
+    # Workers only return their outcome; logging and the manifest stay in this process.
+    # Successes are only counted, with a progress line every PROGRESS_LOG_INTERVAL files
+    processed = errors = 0
+    started = time.monotonic()
+    try:
+        for done, (filename, error) in enumerate(results, 1):
+            if error is None:
+                manifest[filename] = records[filename]
+                processed += 1
+            else:
+                manifest.pop(filename, None)
+                errors += 1
+                logger.error("Error processing %s: %s", filename, error)
+            
+            if done % PROGRESS_LOG_INTERVAL == 0 and done < len(pending):
+                elapsed = time.monotonic() - started
+                logger.info("Processed %d/%d newsletters (%d errors), about %.0fs remaining",
+                            done, len(pending), errors, elapsed / done * (len(pending) - done))
+        
+        if pending:
+            logger.info("Processed %d newsletters (%d errors) in %.1fs",
+                        processed, errors, time.monotonic() - started)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        
+        with open(PROCESSED_MANIFEST, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
 
 def main():
     """Main function to orchestrate the newsletter collection process."""
+    # Parse .env once per run, before anything reads the environment
+    from dotenv import load_dotenv
+    load_dotenv()
+    
     logger.info("Starting Politico Playbook collection")
     
     setup_directories()
@@ -288,10 +288,10 @@ class ConfigurationManager:
             # Update configuration with file data
             self._update_config_from_dict(config_data)
             
-            self.logger.info(f"Configuration loaded from {config_file}")
+            self.logger.info("Configuration loaded from %s", config_file)
             
         except Exception as e:
-            self.logger.error(f"Error loading configuration from {config_file}: {e}")
+            self.logger.error("Error loading configuration from %s: %s", config_file, e)
             raise
     
     def _update_config_from_dict(self, config_data: Dict[str, Any]) -> None:
@@ -379,10 +379,10 @@ class ConfigurationManager:
             with open(output_file, 'w', encoding='utf-8') as f:
                 json.dump(config_dict, f, indent=2, ensure_ascii=False)
             
-            self.logger.info(f"Configuration saved to {output_file}")
+            self.logger.info("Configuration saved to %s", output_file)
             
         except Exception as e:
-            self.logger.error(f"Error saving configuration: {e}")
+            self.logger.error("Error saving configuration: %s", e)
             raise
     
     def update_config(self, updates: Dict[str, Any]) -> None:
@@ -1,13 +1,27 @@
 import imaplib
 import email
-from email.header import decode_header
+import email.policy
 import os
+import re
 import csv
 from datetime import datetime
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# 1 MiB write buffers for the CSV and newsletter files
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Messages requested per UID FETCH, which bounds how much mail is held in memory
+FETCH_WINDOW = 200
+
+# Largest message accepted; the server is asked for at most one byte more, so
+# oversized mail is recognised without downloading all of it
+MAX_MESSAGE_SIZE = 8 << 20
+
+_FETCH_UID_RE = re.compile(rb'UID (\d+)')
+
+# Charset declared by a <meta charset> or http-equiv Content-Type tag; rewritten to
+# utf-8 when a body is re-encoded so the saved file describes itself correctly
+_META_CHARSET_RE = re.compile(r'(<meta\b[^>]*?\bcharset\s*=\s*["\']?)[^"\'\s;/>]+', re.IGNORECASE)
 
 def is_valid_playbook_email(subject, sender_email):
     """
@@ -91,21 +105,17 @@ def clean(text):
     # Clean text for creating a folder
     return "".join(c if c.isalnum() or c in [' ', '.', '_'] else '_' for c in text)
 
-def save_to_csv(date, subject, body, filename="politico_playbook.csv"):
+def save_to_csv(emails, filename="politico_playbook.csv"):
+    """Append (date, subject, body) tuples to the CSV in one batched write."""
     file_exists = os.path.isfile(filename)
     
-    with open(filename, 'a', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ['date', 'subject', 'body']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+    with open(filename, 'a', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as csvfile:
+        writer = csv.writer(csvfile)
         
         if not file_exists:
-            writer.writeheader()
+            writer.writerow(['date', 'subject', 'body'])
         
-        writer.writerow({
-            'date': date,
-            'subject': subject,
-            'body': body
-        })
+        writer.writerows(emails)
         
 def connect_to_email(email_address, password):
     """Connect to Gmail using IMAP."""
@@ -117,6 +127,36 @@ def connect_to_email(email_address, password):
         print(f"Failed to connect to email: {e}")
         return None
 
+def _fetch_messages(mail, uids):
+    """
+    Yield (uid, raw message) pairs, fetching FETCH_WINDOW messages per UID FETCH.
+    
+    BODY.PEEK[] returns the full message like RFC822 but leaves the \\Seen flag
+    alone; the <0.n> partial range stops each one just past MAX_MESSAGE_SIZE.
+    A message the server didn't return is yielded with None.
+    """
+    fetch_items = f'(BODY.PEEK[]<0.{MAX_MESSAGE_SIZE + 1}>)'
+
+    for start in range(0, len(uids), FETCH_WINDOW):
+        window = uids[start:start + FETCH_WINDOW]
+        fetched = {}
+        try:
+            status, data = mail.uid('fetch', b','.join(window), fetch_items)
+            if status == 'OK':
+                # Responses interleave (envelope, message) tuples with closing b')' lines
+                for part in data:
+                    if isinstance(part, tuple):
+                        match = _FETCH_UID_RE.search(part[0])
+                        if match:
+                            fetched[match.group(1)] = part[1]
+            else:
+                print(f"Failed to fetch emails: {data}")
+        except Exception as e:
+            print(f"Error fetching emails: {e}")
+        
+        for uid in window:
+            yield uid, fetched.get(uid)
+
 def extract_playbook_emails(mail, output_dir="newsletters", csv_file="playbook_data.csv", max_emails=10):
     """Extract Politico Playbook emails and save content."""
     # Select the inbox
@@ -141,7 +181,7 @@ def extract_playbook_emails(mail, output_dir="newsletters", csv_file="playbook_d
         
         for criteria in search_criteria:
             try:
-                status, messages = mail.search(None, criteria)
+                status, messages = mail.uid('search', None, criteria)
                 if status == 'OK' and messages[0]:
                     message_ids = messages[0].split()
                     all_message_ids.update(message_ids)
@@ -154,7 +194,7 @@ def extract_playbook_emails(mail, output_dir="newsletters", csv_file="playbook_d
             return "No Politico Playbook emails found with any search criteria."
         
         # Convert back to list and get most recent emails (reverse order for newest first)
-        message_ids = sorted(list(all_message_ids), reverse=True)
+        message_ids = sorted(all_message_ids, key=int, reverse=True)
         num_to_fetch = min(max_emails, len(message_ids))
         recent_ids = message_ids[:num_to_fetch]  # Take first N (most recent)
         
@@ -170,35 +210,24 @@ def extract_playbook_emails(mail, output_dir="newsletters", csv_file="playbook_d
     
     # Create or open CSV file for storing metadata
     csv_exists = os.path.exists(csv_file)
-    with open(csv_file, 'a', newline='') as f:
-        writer = csv.writer(f)
+    
+    # Process each email
+    processed_count = 0
+    with open(csv_file, 'a', newline='', buffering=WRITE_BUFFER_SIZE) as csv_out:
+        writer = csv.writer(csv_out)
         if not csv_exists:
             writer.writerow(["Date", "Subject", "Filename"])
-            
-        # Process each email
-        processed_count = 0
-        for num in recent_ids:
+        
+        for num, raw_email in _fetch_messages(mail, recent_ids):
             try:
-                status, data = mail.fetch(num, '(RFC822)')
-                raw_email = data[0][1]
-                msg = email.message_from_bytes(raw_email)
+                if raw_email is None:
+                    raise LookupError("missing from FETCH response")
+                if len(raw_email) > MAX_MESSAGE_SIZE:
+                    raise ValueError(f"larger than {MAX_MESSAGE_SIZE} bytes")
                 
-                # Extract subject and date with better encoding handling
-                subject_header = msg["subject"]
-                if subject_header:
-                    decoded_parts = decode_header(subject_header)
-                    subject_parts = []
-                    for part, encoding in decoded_parts:
-                        if isinstance(part, bytes):
-                            if encoding:
-                                subject_parts.append(part.decode(encoding))
-                            else:
-                                subject_parts.append(part.decode('utf-8', errors='ignore'))
-                        else:
-                            subject_parts.append(str(part))
-                    subject = ''.join(subject_parts)
-                else:
-                    subject = "No Subject"
+                # The default policy decodes RFC 2047 encoded headers and parses dates
+                msg = email.message_from_bytes(raw_email, policy=email.policy.default)
+                subject = msg["subject"] or "No Subject"
                     
                 # Extract sender email
                 sender_email = msg["from"]
@@ -208,20 +237,16 @@ def extract_playbook_emails(mail, output_dir="newsletters", csv_file="playbook_d
                     print(f"Skipping email with subject: {subject} (failed validation)")
                     continue
                     
-                date_str = msg["date"]
-                date_obj = email.utils.parsedate_to_datetime(date_str)
+                date_obj = msg["date"].datetime
                 formatted_date = date_obj.strftime("%Y-%m-%d")
                 
-                # Extract email body
+                # Extract email body, decoded with the part's declared charset so the file
+                # can be written as the UTF-8 the text extractors expect. Only a text/html
+                # part qualifies, so plain-text-only mail is never saved as a newsletter
                 body = ""
-                if msg.is_multipart():
-                    for part in msg.walk():
-                        content_type = part.get_content_type()
-                        if content_type == "text/html":
-                            body = part.get_payload(decode=True).decode()
-                            break
-                else:
-                    body = msg.get_payload(decode=True).decode()
+                body_part = msg.get_body(preferencelist=('html',))
+                if body_part is not None:
+                    body = _META_CHARSET_RE.sub(r'\1utf-8', body_part.get_content())
                 
                 # Only process if there's a body to save
                 if body:
@@ -229,20 +254,25 @@ def extract_playbook_emails(mail, output_dir="newsletters", csv_file="playbook_d
                     timestamp = date_obj.strftime("%H%M%S")
                     filename = f"{formatted_date}_{timestamp}_email.html"
                     filepath = os.path.join(output_dir, filename)
-                    with open(filepath, "w", encoding="utf-8") as f:
+                    with open(filepath, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
                         f.write(body)
                     
-                    # Save metadata to CSV
+                    # Written through the buffered CSV handle as each file is saved, so a
+                    # failure later in the run still leaves a row for every saved file
                     writer.writerow([formatted_date, subject, filename])
                     processed_count += 1
                     
             except Exception as e:
                 print(f"Error processing email {num}: {e}")
                 continue
-            
+    
     return f"Email extraction complete. Processed {processed_count} emails."
 
 def main():
+    # Load environment variables; done here rather than at import so callers
+    # that already loaded them don't parse .env again
+    load_dotenv()
+    
     # Get credentials from environment variables
     email_address = os.getenv('GMAIL_ADDRESS')
     password = os.getenv('GMAIL_APP_PASSWORD')
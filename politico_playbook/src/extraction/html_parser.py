@@ -1,16 +1,124 @@
-from bs4 import BeautifulSoup
+import threading
+from lxml import etree, html
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Text nodes under an element, outside script and style, compiled once; comments
+# are separate nodes, so they are excluded just as BeautifulSoup's get_text does
+_VISIBLE_TEXT = etree.XPath('descendant-or-self::text()[not(ancestor::script or ancestor::style)]')
 
 # Add this function to your script
 def extract_text_from_html(html_content):
-    soup = BeautifulSoup(html_content, 'html.parser')
+    """
+    Visible text of an HTML document, one stripped phrase per line.
+    
+    Accepts markup as str/UTF-8 bytes, or an already parsed lxml element so
+    callers can pass just the subtree they care about (e.g. a content container).
+    """
+    if isinstance(html_content, bytes):
+        # Decode here so libxml2 doesn't trust a <meta charset> the bytes don't match,
+        # the same UTF-8 reading extract_text_from_html_file uses
+        html_content = html_content.decode('utf-8', 'replace')
+    
+    if isinstance(html_content, etree._Element):
+        tree = html_content
+    else:
+        # Parse and query in libxml2 rather than walking a BeautifulSoup tree
+        try:
+            tree = html.document_fromstring(html_content)
+        except etree.ParserError:  # empty document
+            return ''
+    
+    return _clean_text(''.join(_VISIBLE_TEXT(tree)))
+
+
+class _VisibleTextTarget:
+    """Parser target that keeps text outside script and style as the document streams past."""
+    
+    def __init__(self):
+        self.parts = []
+        self.hidden_depth = 0
+    
+    def start(self, tag, attrib):
+        if tag in ('script', 'style'):
+            self.hidden_depth += 1
+    
+    def end(self, tag):
+        if tag in ('script', 'style'):
+            self.hidden_depth -= 1
+    
+    def data(self, data):
+        if not self.hidden_depth:
+            self.parts.append(data)
+    
+    def close(self):
+        text = ''.join(self.parts)
+        self.parts = []
+        return text
+
+
+# One streaming parser per thread, reused across files; lxml parsers must not be
+# shared between threads
+_thread_parsers = threading.local()
+
+
+def _text_parser():
+    """This thread's streaming parser, created on first use."""
+    parser = getattr(_thread_parsers, 'parser', None)
+    if parser is None:
+        parser = _thread_parsers.parser = etree.HTMLParser(
+            target=_VisibleTextTarget(), encoding='utf-8', remove_comments=True, remove_pis=True
+        )
+    return parser
+
+
+def extract_text_from_html_file(path):
+    """
+    Same text as extract_text_from_html, read from a UTF-8 HTML file.
     
-    # Remove script and style elements
-    for script in soup(["script", "style"]):
-        script.extract()
+    With selectolax installed, lexbor parses the file's bytes and returns the
+    text in one call, about twice as fast as lxml. Otherwise libxml2 reads the
+    file itself into this thread's long-lived parser, whose target collects
+    text events, so neither the file's bytes nor a tree are ever materialised
+    in Python and memory stays proportional to the text.
+    """
+    if LexborHTMLParser is not None:
+        return _lexbor_text_from_file(path)
     
-    # Get text
-    text = soup.get_text()
+    parser = _text_parser()
+    try:
+        # libxml2 reports a missing or unreadable path as an empty document, so
+        # open it here first to keep the usual OSError
+        with open(path, 'rb'):
+            text = etree.parse(path, parser)
+    except etree.XMLSyntaxError:  # empty document
+        return ''
+    except BaseException:
+        # A parser interrupted mid-document can't be reused; the next call builds a fresh one
+        _thread_parsers.parser = None
+        raise
+    return _clean_text(text)
+
+
+def _lexbor_text_from_file(path):
+    """Visible text of an HTML file via selectolax's lexbor parser, cleaned like the lxml path."""
+    with open(path, 'rb') as f:
+        tree = LexborHTMLParser(f.read())
     
+    # lexbor decodes the bytes as UTF-8 and drops comments, as the lxml parser is
+    # configured to; unlike lxml it keeps <template> contents out of the text
+    tree.strip_tags(['script', 'style'])
+    root = tree.root
+    if root is None:
+        return ''
+    return _clean_text(root.text(deep=True, separator='', strip=False))
+
+
+def _clean_text(text):
+    """Break text into stripped lines and phrases, dropping blank ones."""
     # Break into lines and remove leading and trailing space on each
     lines = (line.strip() for line in text.splitlines())
     
@@ -18,7 +126,4 @@ def extract_text_from_html(html_content):
     chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
     
     # Drop blank lines
-    text = '\n'.join(chunk for chunk in chunks if chunk)
-    
-    
-    return text
\ No newline at end of file
+    return '\n'.join(chunk for chunk in chunks if chunk)
@@ -8,37 +8,110 @@ following the schema defined in src/models/schemas.py
 import re
 import json
 import os
-import csv
+import multiprocessing
 from datetime import datetime
-from bs4 import BeautifulSoup
+from functools import lru_cache, partial
+import pandas as pd
+from bs4 import BeautifulSoup, SoupStrainer
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
 
-def extract_sponsor_info(soup):
-    """Extract sponsor information from newsletter HTML."""
-    sponsor = None
+
+# 64 KB buffers cut the number of read/write syscalls per newsletter
+IO_BUFFER_SIZE = 1 << 16
+
+
+# Only these subtrees are needed by the extractors below; everything else
+# (head metadata, scripts, styles) is skipped at parse time.
+NEWSLETTER_STRAINER = SoupStrainer(['a', 'img', 'div', 'body', 'p', 'span'])
+
+# Newsletter contact address to playbook type mapping
+EMAIL_TO_TYPE = {
+    'playbook@politico.com': 'national_playbook',
+    'awren@politico.com': 'national_playbook',  # Adam Wren 
+    'zstanton@politico.com': 'national_playbook',  # Zack Stanton
+    'cmahtesian@politico.com': 'national_playbook',  # Charlie Mahtesian
+    'jcoltin@politico.com': 'new_york_playbook',  # Jeff Coltin
+    'nreisman@politico.com': 'new_york_playbook',  # Nick Reisman
+    'engo@politico.com': 'new_york_playbook',  # Emily Ngo
+    'jbeeferman@politico.com': 'new_york_playbook',  # Joe Beeferman
+    'ecordover@politico.com': 'transgender_sports_newsletter',  # Erin Cordover - specialized
+    'klong@politico.com': 'womens_rule',  # Katherine Long
+    'massachusettsplaybook@email.politico.com': 'massachusetts_playbook'
+    # Add more mappings as we identify them
+}
+
+# Footer text marking unsubscribe/legal boilerplate to strip
+FOOTER_KEYWORDS = ('unsubscribe', 'privacy policy', 'terms', 'copyright', '1000 wilson blvd')
+
+# Patterns applied to every newsletter, compiled once at import time
+_PRESENTED_BY_PATTERNS = (
+    re.compile(r'presented by\s*([^:]+)', re.IGNORECASE),
+    re.compile(r'presented by:\s*([^\n\r]+)', re.IGNORECASE),
+)
+_BY_NAME_RE = re.compile(r'By\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', re.MULTILINE)  # "By FirstName LastName"
+_STANDALONE_NAME_RE = re.compile(r'^\s*([A-Z][a-z]+\s+[A-Z][a-z]+)\s*$', re.MULTILINE)  # Standalone "FirstName LastName"
+_HELP_RE = re.compile(r'With help from\s+([^.\n]+)', re.IGNORECASE)
+_HELPER_NAME_RE = re.compile(r'^[A-Z][a-z]+(\s+[A-Z][a-z]+)*$')
+_NAME_SPLIT_RE = re.compile(r',\s*|\s+and\s+')
+_WS_RE = re.compile(r'(\n\s*\n)|([ \t]+)')
+_PREVIEW_STYLE_RE = re.compile(r'display:none')  # hidden preview-text div
+_MAILTO_HREF_RE = re.compile(r'mailto:')
+_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+_FOOTER_RE = re.compile('|'.join(map(re.escape, FOOTER_KEYWORDS)), re.IGNORECASE)
+
+
+def write_json(path, data):
+    """Write data as indented UTF-8 JSON using a single buffered write."""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    with open(path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+        f.write(payload)
+
+
+def parse_newsletter_html(html_content):
+    """
+    Parse newsletter HTML, restricting the tree to the relevant subtrees.
+    
+    Falls back to a full parse if straining leaves no usable content.
+    """
+    soup = BeautifulSoup(html_content, 'html.parser', parse_only=NEWSLETTER_STRAINER)
+    if not soup.contents:
+        soup = BeautifulSoup(html_content, 'html.parser')
+    return soup
+
+
+def extract_sponsor_info(soup, full_text=None):
+    """
+    Extract sponsor information from newsletter HTML.
     
-    # Look for "Presented by" text
-    presented_by_patterns = [
-        r'presented by\s*([^:]+)',
-        r'presented by:\s*([^\n\r]+)',
-    ]
+    Args:
+        soup: Parsed newsletter HTML
+        full_text: Precomputed soup.get_text(), to avoid another tree walk
+    """
+    sponsor = None
     
     # Check preview text first
-    preview_div = soup.find('div', style=lambda x: x and 'display:none' in x)
+    preview_div = soup.find('div', style=_PREVIEW_STYLE_RE)
     if preview_div:
         preview_text = preview_div.get_text()
-        for pattern in presented_by_patterns:
-            match = re.search(pattern, preview_text, re.IGNORECASE)
+        for pattern in _PRESENTED_BY_PATTERNS:
+            match = pattern.search(preview_text)
             if match:
                 sponsor = match.group(1).strip()
                 break
     
     # If not found in preview, check main content
     if not sponsor:
-        text_content = soup.get_text()
-        for pattern in presented_by_patterns:
-            match = re.search(pattern, text_content, re.IGNORECASE)
+        text_content = full_text if full_text is not None else soup.get_text()
+        for pattern in _PRESENTED_BY_PATTERNS:
+            match = pattern.search(text_content)
             if match:
                 sponsor = match.group(1).strip()
                 break
@@ -46,85 +119,111 @@ def extract_sponsor_info(soup):
     return sponsor
 
 
-def extract_authors(soup):
-    """Extract author information from newsletter HTML with improved accuracy."""
-    authors = []
+def _split_mailto(href):
+    """Split a mailto href into (username, domain); either part is None when missing."""
+    _, found, rest = href.partition('mailto:')
+    if not found:
+        return None, None
+    username, sep, domain = rest.partition('@')
+    if not sep or not username:
+        return None, None
+    
+    # Drop any query string (?subject=..., &cc=...) and trailing whitespace
+    domain = domain.split('?', 1)[0].split('&', 1)[0]
+    domain = domain.split(None, 1)[0] if domain[:1].strip() else ''
+    return username, domain or None
+
+
+@lru_cache(maxsize=4096)
+def _looks_like_name(author):
+    """Final validation for an author candidate: two or three capitalized words."""
+    if len(author) <= 2:
+        return False
+    words = author.split()
+    return (2 <= len(words) <= 3 and 
+            all(word[0].isupper() and word[1:].islower() for word in words if word))
+
+
+def extract_authors(soup, full_text=None):
+    """
+    Extract author information from newsletter HTML with improved accuracy.
+    
+    Args:
+        soup: Parsed newsletter HTML
+        full_text: Precomputed soup.get_text(), to avoid another tree walk
+    """
+    # Dict used as an insertion-ordered set for O(1) duplicate checks
+    authors = {}
     
     # Find the author byline area (usually near the top after the header)
-    text_content = soup.get_text()
-    lines = text_content.split('\n')
+    text_content = full_text if full_text is not None else soup.get_text()
     
     # Look for email links first (most reliable method)
-    email_links = soup.find_all('a', href=lambda x: x and 'mailto:' in x)
+    email_links = soup.find_all('a', href=_MAILTO_HREF_RE)
     for link in email_links:
         href = link.get('href', '')
         if '@politico.com' in href:
             # Extract email address
-            email_match = re.search(r'mailto:([^@]+)@', href)
-            if email_match:
-                email_username = email_match.group(1)
-                
+            email_username, _ = _split_mailto(href)
+            if email_username:
                 # Try to find the display name associated with this email
                 link_text = link.get_text(strip=True)
                 if link_text and len(link_text) < 50 and ' ' in link_text:
                     # This looks like a real name
-                    if link_text not in authors:
-                        authors.append(link_text)
+                    authors[link_text] = None
                 elif email_username:
                     # Convert email username to likely name format
                     name_from_email = email_username.replace('.', ' ').replace('_', ' ').title()
-                    if name_from_email not in authors and len(name_from_email) > 3:
-                        authors.append(name_from_email)
+                    if len(name_from_email) > 3:
+                        authors[name_from_email] = None
     
     # Look for "By [Name]" patterns in the first 20 lines (header area)
-    header_text = '\n'.join(lines[:20])
-    by_patterns = [
-        r'By\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',  # "By FirstName LastName"
-        r'^\s*([A-Z][a-z]+\s+[A-Z][a-z]+)\s*$'     # Standalone "FirstName LastName"
-    ]
-    
-    for pattern in by_patterns:
-        matches = re.finditer(pattern, header_text, re.MULTILINE)
+    header_end = -1
+    for _ in range(20):
+        header_end = text_content.find('\n', header_end + 1)
+        if header_end == -1:
+            break
+    header_text = text_content[:header_end] if header_end != -1 else text_content
+    
+    for pattern in (_BY_NAME_RE, _STANDALONE_NAME_RE):
+        matches = pattern.finditer(header_text)
         for match in matches:
             potential_author = match.group(1).strip()
             # Validate it looks like a real name
             if (len(potential_author.split()) >= 2 and 
                 len(potential_author) < 30 and 
                 not any(keyword in potential_author.lower() for keyword in 
-                       ['presented', 'association', 'politico', 'guide', 'unofficial']) and
-                potential_author not in authors):
-                authors.append(potential_author)
+                       ['presented', 'association', 'politico', 'guide', 'unofficial'])):
+                authors[potential_author] = None
     
     # Look for "With help from [Names]" pattern
-    help_pattern = r'With help from\s+([^.\n]+)'
-    help_matches = re.finditer(help_pattern, text_content, re.IGNORECASE)
+    help_matches = _HELP_RE.finditer(text_content)
     for match in help_matches:
         help_text = match.group(1).strip()
         # Split on common separators
-        helper_names = re.split(r',\s*|\s+and\s+', help_text)
+        helper_names = _NAME_SPLIT_RE.split(help_text)
         for name in helper_names:
             name = name.strip()
             # Validate it's a reasonable name
             if (2 <= len(name.split()) <= 3 and 
                 len(name) < 30 and
-                re.match(r'^[A-Z][a-z]+(\s+[A-Z][a-z]+)*$', name) and
-                name not in authors):
-                authors.append(name)
+                _HELPER_NAME_RE.match(name)):
+                authors[name] = None
     
-    # Remove duplicates while preserving order and clean up
+    # Clean up, keeping first-seen order; stripping can only merge duplicates
     cleaned_authors = []
-    for author in authors:
-        author = author.strip()
-        if author and author not in cleaned_authors and len(author) > 2:
-            # Final validation - should look like a real name
-            words = author.split()
-            if (2 <= len(words) <= 3 and 
-                all(word[0].isupper() and word[1:].islower() for word in words if word)):
-                cleaned_authors.append(author)
+    for author in dict.fromkeys(author.strip() for author in authors):
+        if _looks_like_name(author):
+            cleaned_authors.append(author)
     
     return cleaned_authors[:5]  # Limit to maximum 5 authors to prevent false positives
 
 
+def _normalize_whitespace(match):
+    """Collapse blank-line runs to one blank line and space/tab runs to one space."""
+    return '\n\n' if match.group(1) else ' '
+
+
 def clean_newsletter_text(soup):
     """Extract and clean the main newsletter text content."""
     
@@ -133,103 +232,94 @@ def clean_newsletter_text(soup):
         element.decompose()
     
     # Remove hidden preview text
-    for div in soup.find_all('div', style=lambda x: x and 'display:none' in x):
+    for div in soup.find_all('div', style=_PREVIEW_STYLE_RE):
         div.decompose()
     
     # Remove unsubscribe footers and similar
-    footer_keywords = ['unsubscribe', 'privacy policy', 'terms', 'copyright', '1000 wilson blvd']
-    for element in soup.find_all(string=True):  # Use 'string' instead of 'text'
-        if element and any(keyword in element.lower() for keyword in footer_keywords):
-            try:
-                parent = element.parent
-                if parent and parent.name:  # Make sure parent exists and is a tag
-                    parent.decompose()
-            except AttributeError:
-                continue
+    for element in soup.find_all(string=_FOOTER_RE):
+        try:
+            parent = element.parent
+            if parent and parent.name:  # Make sure parent exists and is a tag
+                parent.decompose()
+        except AttributeError:
+            continue
     
     # Get clean text
     text = soup.get_text()
     
     # Clean up whitespace
-    text = re.sub(r'\n\s*\n', '\n\n', text)  # Normalize line breaks
-    text = re.sub(r'[ \t]+', ' ', text)      # Normalize spaces
+    text = _WS_RE.sub(_normalize_whitespace, text)
     text = text.strip()
     
     return text
 
 
-def determine_newsletter_type(soup, text, subject):
-    """Determine the type of newsletter based on email addresses, images, and content."""
-    text_lower = text.lower()
-    subject_lower = subject.lower() if subject else ""
-    
-    # Email address to playbook type mapping
-    email_to_type = {
-        'playbook@politico.com': 'national_playbook',
-        'awren@politico.com': 'national_playbook',  # Adam Wren 
-        'zstanton@politico.com': 'national_playbook',  # Zack Stanton
-        'cmahtesian@politico.com': 'national_playbook',  # Charlie Mahtesian
-        'jcoltin@politico.com': 'new_york_playbook',  # Jeff Coltin
-        'nreisman@politico.com': 'new_york_playbook',  # Nick Reisman
-        'engo@politico.com': 'new_york_playbook',  # Emily Ngo
-        'jbeeferman@politico.com': 'new_york_playbook',  # Joe Beeferman
-        'ecordover@politico.com': 'transgender_sports_newsletter',  # Erin Cordover - specialized
-        'klong@politico.com': 'womens_rule',  # Katherine Long
-        'massachusettsplaybook@email.politico.com': 'massachusetts_playbook'
-        # Add more mappings as we identify them
-    }
-    
-    # Check email addresses first (most reliable)
-    email_links = soup.find_all('a', href=lambda x: x and 'mailto:' in x)
-    for link in email_links:
-        href = link.get('href', '')
-        if 'mailto:' in href:
-            email_match = re.search(r'mailto:([^@]+@[^?&\s]+)', href)
-            if email_match:
-                email_address = email_match.group(1).lower()
-                if email_address in email_to_type:
-                    return email_to_type[email_address]
-    
-    # Check image headers for newsletter type
-    img_tags = soup.find_all('img')
-    for img in img_tags:
-        src = img.get('src', '').lower()
-        alt = img.get('alt', '').lower()
-        title = img.get('title', '').lower()
-        
-        if 'new-york-playbook' in src:
-            if 'pm' in src:
-                return 'new_york_playbook_pm'
-            else:
-                return 'new_york_playbook'
-        elif 'california-playbook' in src:
-            return 'california_playbook'
-        elif 'florida-playbook' in src:
-            return 'florida_playbook'
-        elif 'playbook.jpg' in src or 'playbook' in title.lower():
-            return 'national_playbook'
-        elif 'pulse' in src:
-            return 'politico_pulse'
-        elif 'nightly' in src:
-            return 'politico_nightly'
-    
-    # Check preview text (hidden div)
-    preview_div = soup.find('div', style=lambda x: x and 'display:none' in x)
-    if preview_div:
-        preview_text = preview_div.get_text().lower()
-        
-        if 'new yorkers' in preview_text and 'afternoon' in preview_text:
+def _type_from_emails(soup):
+    """Return the newsletter type implied by the first known mailto address, if any."""
+    for link in soup.find_all('a', href=_MAILTO_HREF_RE):
+        email_username, email_domain = _split_mailto(link.get('href', ''))
+        if email_domain:
+            email_address = f"{email_username}@{email_domain}".lower()
+            newsletter_type = EMAIL_TO_TYPE.get(email_address)
+            if newsletter_type:
+                return newsletter_type
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _classify_image_src(src, title=''):
+    """Map a header image's src (and title) to a newsletter type, if recognizable."""
+    src = src.lower()
+    if 'new-york-playbook' in src:
+        if 'pm' in src:
             return 'new_york_playbook_pm'
-        elif 'new yorkers' in preview_text:
+        else:
             return 'new_york_playbook'
-        elif 'california' in preview_text:
-            return 'california_playbook'
-        elif 'florida' in preview_text:
-            return 'florida_playbook'
-        elif 'unofficial guide to official washington' in preview_text:
-            return 'national_playbook'
-    
-    # Fallback to content analysis
+    elif 'california-playbook' in src:
+        return 'california_playbook'
+    elif 'florida-playbook' in src:
+        return 'florida_playbook'
+    elif 'playbook.jpg' in src or 'playbook' in title.lower():
+        return 'national_playbook'
+    elif 'pulse' in src:
+        return 'politico_pulse'
+    elif 'nightly' in src:
+        return 'politico_nightly'
+    return None
+
+
+def _type_from_images(soup):
+    """Return the newsletter type implied by the header images, if any."""
+    for img in soup.find_all('img'):
+        newsletter_type = _classify_image_src(img.get('src', ''), img.get('title', ''))
+        if newsletter_type:
+            return newsletter_type
+    return None
+
+
+def _type_from_preview(soup):
+    """Return the newsletter type implied by the hidden preview text, if any."""
+    preview_div = soup.find('div', style=_PREVIEW_STYLE_RE)
+    if not preview_div:
+        return None
+    
+    preview_text = preview_div.get_text().lower()
+    if 'new yorkers' in preview_text and 'afternoon' in preview_text:
+        return 'new_york_playbook_pm'
+    elif 'new yorkers' in preview_text:
+        return 'new_york_playbook'
+    elif 'california' in preview_text:
+        return 'california_playbook'
+    elif 'florida' in preview_text:
+        return 'florida_playbook'
+    elif 'unofficial guide to official washington' in preview_text:
+        return 'national_playbook'
+    return None
+
+
+def _type_from_text(text, subject_lower):
+    """Classify the newsletter from its body text and subject line."""
+    text_lower = text.lower()
     if 'new york' in text_lower and 'playbook' in text_lower:
         if 'afternoon' in text_lower or 'pm' in subject_lower:
             return 'new_york_playbook_pm'
@@ -249,6 +339,19 @@ def determine_newsletter_type(soup, text, subject):
         return 'politico_newsletter'
 
 
+def determine_newsletter_type(soup, text, subject):
+    """Determine the type of newsletter based on email addresses, images, and content."""
+    # Most reliable signals first; stop at the first one that matches
+    for detector in (_type_from_emails, _type_from_images, _type_from_preview):
+        newsletter_type = detector(soup)
+        if newsletter_type:
+            return newsletter_type
+    
+    # Fallback to content analysis
+    subject_lower = subject.lower() if subject else ""
+    return _type_from_text(text, subject_lower)
+
+
 def html_to_json(html_file_path, subject=None, date=None):
     """
     Convert a single HTML newsletter file to JSON format.
@@ -262,16 +365,17 @@ def html_to_json(html_file_path, subject=None, date=None):
         Dictionary with structured newsletter data
     """
     
-    # Read HTML file
-    with open(html_file_path, 'r', encoding='utf-8') as f:
+    # Read HTML file; saved newsletters are always UTF-8, whatever their meta tags say
+    with open(html_file_path, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
         html_content = f.read()
     
     # Parse HTML
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = parse_newsletter_html(html_content)
     
-    # Extract metadata
-    sponsor = extract_sponsor_info(soup)
-    authors = extract_authors(soup)
+    # Extract metadata from a single text walk of the unmodified tree
+    full_text = soup.get_text()
+    sponsor = extract_sponsor_info(soup, full_text)
+    authors = extract_authors(soup, full_text)
     clean_text = clean_newsletter_text(soup)
     
     # Get file info
@@ -279,7 +383,7 @@ def html_to_json(html_file_path, subject=None, date=None):
     
     # Extract date from filename if not provided
     if not date:
-        date_match = re.search(r'(\d{4}-\d{2}-\d{2})', file_name)
+        date_match = _DATE_RE.search(file_name)
         if date_match:
             date = date_match.group(1)
     
@@ -300,56 +404,95 @@ def html_to_json(html_file_path, subject=None, date=None):
     return newsletter_data
 
 
-def process_newsletter_batch(csv_file_path, raw_html_dir, output_dir):
+def _process_one(row, raw_html_dir, output_dir):
+    """
+    Convert and save a single newsletter listed in the CSV metadata.
+    
+    Kept at module level so it can be dispatched to worker processes.
+    
+    Args:
+        row: (date, subject, filename) tuple from the metadata CSV
+        raw_html_dir: Path of the directory containing raw HTML files
+        output_dir: Path of the directory to save JSON files
+    
+    Returns:
+        Tuple of (status, message) where status is 'ok' or 'error'
+    """
+    date, subject, filename = row
+    try:
+        # Build paths
+        html_file_path = raw_html_dir / filename
+        json_file_path = output_dir / html_file_path.with_suffix('.json').name
+        
+        # Convert to JSON
+        newsletter_json = html_to_json(html_file_path, subject, date)
+        
+        # Save JSON file
+        write_json(json_file_path, newsletter_json)
+        
+        return 'ok', f"✓ Processed: {subject[:50]}... -> {json_file_path.name}"
+        
+    except Exception as e:
+        return 'error', f"Error processing {filename or 'unknown'}: {e}"
+
+
+def process_newsletter_batch(csv_file_path, raw_html_dir, output_dir, workers=None):
     """
     Process a batch of newsletters from CSV metadata file.
     
+    Newsletters are parsed in parallel across worker processes, since the
+    BeautifulSoup parse and regex extraction are CPU-bound.
+    
     Args:
         csv_file_path: Path to CSV file with newsletter metadata
         raw_html_dir: Directory containing raw HTML files
         output_dir: Directory to save JSON files
+        workers: Number of worker processes (defaults to CPU count; 1 runs serially)
     """
     
+    raw_html_dir = Path(raw_html_dir)
+    output_dir = Path(output_dir)
+    
     # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
+    output_dir.mkdir(parents=True, exist_ok=True)
     
     processed_count = 0
     errors = []
     
-    # Read newsletter metadata
-    with open(csv_file_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        
-        for row in reader:
-            try:
-                date = row.get('Date')
-                subject = row.get('Subject')
-                filename = row.get('Filename')
-                
-                # Build paths
-                html_file_path = os.path.join(raw_html_dir, filename)
-                
-                if not os.path.exists(html_file_path):
-                    print(f"Warning: HTML file not found: {html_file_path}")
-                    continue
-                
-                # Convert to JSON
-                newsletter_json = html_to_json(html_file_path, subject, date)
-                
-                # Save JSON file
-                json_filename = filename.replace('.html', '.json')
-                json_file_path = os.path.join(output_dir, json_filename)
-                
-                with open(json_file_path, 'w', encoding='utf-8') as json_file:
-                    json.dump(newsletter_json, json_file, indent=2, ensure_ascii=False)
-                
+    # Read newsletter metadata in one pass, keeping empty fields as ''
+    metadata = pd.read_csv(csv_file_path, usecols=['Date', 'Subject', 'Filename'],
+                           dtype=str, keep_default_na=False, encoding='utf-8')
+    
+    # One directory listing replaces a stat call per row
+    existing = set(os.listdir(raw_html_dir))
+    found = metadata['Filename'].isin(existing)
+    for filename in metadata.loc[~found, 'Filename']:
+        print(f"Warning: HTML file not found: {raw_html_dir / filename}")
+    
+    rows = list(metadata.loc[found, ['Date', 'Subject', 'Filename']].itertuples(index=False, name=None))
+    
+    worker = partial(_process_one, raw_html_dir=raw_html_dir, output_dir=output_dir)
+    workers = workers or os.cpu_count() or 1
+    
+    pool = None
+    if workers > 1 and len(rows) > 1:
+        pool = multiprocessing.Pool(min(workers, len(rows)))
+        results = pool.imap_unordered(worker, rows, chunksize=8)
+    else:
+        results = map(worker, rows)
+    
+    try:
+        for status, message in results:
+            if status == 'ok':
                 processed_count += 1
-                print(f"✓ Processed: {subject[:50]}... -> {json_filename}")
-                
-            except Exception as e:
-                error_msg = f"Error processing {row.get('Filename', 'unknown')}: {e}"
-                errors.append(error_msg)
-                print(f"✗ {error_msg}")
+                print(message)
+            else:
+                errors.append(message)
+                print(f"✗ {message}")
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
     
     print(f"\n=== Processing Complete ===")
     print(f"Successfully processed: {processed_count} newsletters")
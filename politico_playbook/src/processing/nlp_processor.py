@@ -8,12 +8,127 @@ from Politico newsletter text content.
 import re
 import json
 import os
+import sys
+import hashlib
+import heapq
+import multiprocessing
+from bisect import bisect_left
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Set
 import spacy
-from spacy.matcher import Matcher
-from spacy.tokens import Doc, Span
+from spacy.matcher import Matcher, PhraseMatcher
+from spacy.tokens import Doc, DocBin, Span
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib decoder
+    orjson = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Components whose output is never read; NER stays enabled for the ENT_TYPE patterns.
+# Add "senter" back explicitly if an extractor ever needs sentence boundaries.
+DISABLED_PIPES = ("tagger", "parser", "lemmatizer", "attribute_ruler")
+
+
+def _compile_scan_pattern(pattern: str):
+    """
+    Compile a case-insensitive pattern used to sweep whole documents.
+    
+    Uses RE2's linear-time engine when google-re2 is installed. \\w and \\s are
+    spelled out as Unicode classes there, since RE2's shorthands are ASCII-only
+    and would otherwise disagree with the re module on accented names and
+    non-breaking spaces.
+    """
+    if re2 is None:
+        return re.compile(pattern, re.IGNORECASE)
+    pattern = pattern.replace(r'\w', r'[\p{L}\p{N}_]').replace(r'\s', r'[\t-\r\x1c-\x1f\x85\p{Z}]')
+    return re2.compile('(?i)' + pattern)
+
+
+# Regex patterns, compiled once at import rather than on every document
+_PARTY_PATTERNS = (
+    re.compile(r'\(([DR])-([A-Z]{2})\)', re.IGNORECASE),  # (D-NY) or (R-TX)
+    re.compile(r'democrat(?:ic)?', re.IGNORECASE),
+    re.compile(r'republican', re.IGNORECASE),
+)
+
+# Organization name keywords by type; government wins when both match (e.g. 'committee')
+_ORG_TYPE_PATTERNS = (
+    ('government', re.compile('committee|department|agency|bureau|service|'
+                              'administration|commission|board|office|court')),
+    ('political', re.compile('party|democratic|republican|pac|campaign|caucus')),
+)
+
+# Event keywords never overlap, so one alternation finds them all in a single scan;
+# the matching group's name is the event type
+_EVENT_RE = _compile_scan_pattern(
+    r'(?P<meeting>meeting\s+(?:with|between))'
+    r'|(?P<hearing>hearing\s+on)'
+    r'|(?P<vote>vote\s+on)'
+    r'|(?P<confirmation>confirmation\s+of)'
+    r'|(?P<nomination>nomination\s+of)'
+    r'|(?P<appointment>appointment\s+of)'
+    r'|(?P<resignation>resignation\s+of)'
+)
+
+# Policy and relationship patterns can overlap one another, so each keeps its own scan
+_POLICY_PATTERNS = (
+    (_compile_scan_pattern(r'(?:bill|legislation|act|amendment)\s+[A-Z0-9-]+'), 'legislation'),
+    (_compile_scan_pattern(r'(?:budget|spending|funding|appropriations)'), 'fiscal'),
+    (_compile_scan_pattern(r'(?:tariff|trade|import|export)'), 'trade'),
+    (_compile_scan_pattern(r'(?:healthcare|health\s+care|medicaid|medicare)'), 'healthcare'),
+    (_compile_scan_pattern(r'(?:climate|environment|energy)'), 'environment'),
+)
+
+_MEETING_PATTERNS = (
+    _compile_scan_pattern(r'(\w+(?:\s+\w+)*?)\s+(?:met|meeting|meets)\s+with\s+(\w+(?:\s+\w+)*?)(?:\s|$|\.)'),
+    _compile_scan_pattern(r'(\w+(?:\s+\w+)*?)\s+and\s+(\w+(?:\s+\w+)*?)\s+(?:met|meeting)(?:\s|$|\.)'),
+)
+
+_APPOINTMENT_PATTERNS = (
+    _compile_scan_pattern(r'(\w+(?:\s+\w+)*?)\s+(?:nominated|appointed|named)\s+(\w+(?:\s+\w+)*?)\s+(?:as|for|to)'),
+    _compile_scan_pattern(r'(\w+(?:\s+\w+)*?)\s+(?:confirmed|approved)\s+(?:as|for|to)\s+(\w+(?:\s+\w+)*?)'),
+)
+
+_POSITION_PATTERNS = (
+    _compile_scan_pattern(r'(\w+(?:\s+\w+)*?)\s+(?:supports|opposes|backs|endorses)\s+(\w+(?:\s+\w+)*?)(?:\s|$|\.)'),
+    _compile_scan_pattern(r'(\w+(?:\s+\w+)*?)\s+(?:voted|votes)\s+(?:for|against)\s+(\w+(?:\s+\w+)*?)(?:\s|$|\.)'),
+)
+
+_COMMUNICATION_PATTERNS = (
+    _compile_scan_pattern(r'(\w+(?:\s+\w+)*?)\s+(?:told|said\s+to|wrote\s+to)\s+(\w+(?:\s+\w+)*?)(?:\s|$|\.)'),
+    _compile_scan_pattern(r'(\w+(?:\s+\w+)*?)\s+and\s+(\w+(?:\s+\w+)*?)\s+(?:discussed|talked\s+about)(?:\s|$|\.)'),
+)
+
+# Keyword lists for the context analyzer
+TOPIC_KEYWORDS = {
+    'budget': ('budget', 'spending', 'appropriations', 'funding'),
+    'nominations': ('nominee', 'confirmation', 'appointment'),
+    'legislation': ('bill', 'vote', 'committee', 'markup'),
+    'foreign_policy': ('international', 'foreign', 'diplomacy', 'trade'),
+    'elections': ('campaign', 'election', 'polling', 'candidate')
+}
+POSITIVE_WORDS = ('success', 'agreement', 'progress', 'support', 'approval')
+NEGATIVE_WORDS = ('crisis', 'failure', 'oppose', 'controversy', 'scandal')
+URGENCY_INDICATORS = (
+    'breaking', 'urgent', 'immediately', 'crisis', 'emergency',
+    'deadline', 'last minute', 'rushed', 'pressure'
+)
+
+
+def _doc_text(doc: Doc) -> str:
+    """Document text, from the per-doc cache when set; Doc.text re-joins every token on access."""
+    text = doc._.raw_text
+    return text if text is not None else doc.text
 
 
 class NewsletterNLPProcessor:
@@ -28,17 +143,37 @@ class NewsletterNLPProcessor:
     - Policy positions and legislative actions
     """
     
-    def __init__(self, model_name: str = "en_core_web_lg", lexicon_path: Optional[str] = None):
+    def __init__(self, model_name: str = "en_core_web_lg", lexicon_path: Optional[str] = None,
+                 disable: Iterable[str] = DISABLED_PIPES, cache_dir: Optional[Path] = None,
+                 skip_off_topic: bool = False):
         """
         Initialize the NLP processor.
         
         Args:
             model_name: spaCy model to use
             lexicon_path: Path to political lexicon JSON file
+            disable: Pipeline components to skip; extraction only reads doc.ents and doc.text
+            cache_dir: Directory for serialized Docs, so reruns over unchanged text skip the pipeline
+            skip_off_topic: Skip the pipeline for texts mentioning no lexicon term or political title
         """
-        self.nlp = spacy.load(model_name)
+        self.nlp = spacy.load(model_name, disable=list(disable))
         self.matcher = Matcher(self.nlp.vocab)
         
+        # Optional on-disk Doc cache; keys include the model and its disabled components, so
+        # upgrades or a different pipeline configuration don't reuse stale parses
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            meta = self.nlp.meta
+            disabled = ','.join(sorted(self.nlp.disabled))
+            self._cache_salt = f"{meta.get('lang')}_{meta.get('name')}-{meta.get('version')}:{disabled}".encode('utf-8')
+        
+        # Document text and its lowercase form, computed once per doc and shared by the extractors
+        if not Doc.has_extension("raw_text"):
+            Doc.set_extension("raw_text", default=None)
+        if not Doc.has_extension("lower_text"):
+            Doc.set_extension("lower_text", default=None)
+        
         # Load political lexicon
         if lexicon_path is None:
             lexicon_path = Path(__file__).parent.parent.parent / "config" / "lexicon.json"
@@ -51,15 +186,94 @@ class NewsletterNLPProcessor:
         
         # Setup custom patterns
         self._setup_custom_patterns()
+        
+        # Cheap keyword prefilter run before spaCy, when enabled
+        self._prefilter_re = self._build_prefilter() if skip_off_topic else None
+    
+    def _build_prefilter(self):
+        """Compile one case-insensitive alternation over every lexicon term and political title."""
+        terms = set(self.entity_extractor.political_titles) | set(self.entity_extractor.government_orgs)
+        for section in ('terms', 'acronyms', 'roles', 'euphemisms', 'current_figures', 'organizations'):
+            for key, entry in self.lexicon.get(section, {}).items():
+                terms.add(key.lower())
+                terms.update(alias.lower() for alias in entry.get('aliases', []))
+                terms.update(acronym.lower() for acronym in entry.get('acronyms', []))
+        terms.discard('')
+        
+        if not terms:
+            return None
+        return re.compile('|'.join(map(re.escape, sorted(terms, key=len, reverse=True))), re.IGNORECASE)
+    
+    def _pipeline_text(self, newsletter_data: Dict) -> str:
+        """Text to run through spaCy; empty when the newsletter has none or fails the prefilter."""
+        text = newsletter_data.get('text', '') or ''
+        if text and self._prefilter_re is not None and not self._prefilter_re.search(text):
+            return ''
+        return text
+    
+    def _empty_results(self) -> Dict:
+        """NLP results for a newsletter the prefilter ruled off-topic."""
+        return {
+            'entities': {'persons': [], 'organizations': [], 'locations': [], 'events': [], 'policies': []},
+            'relationships': [],
+            'context': {
+                'main_topics': [],
+                'sentiment': 'neutral',
+                'key_figures': [],
+                'political_events': {},
+                'urgency_indicators': []
+            },
+            'processing_timestamp': datetime.now().isoformat(),
+            'model_version': self.nlp.meta.get('version', 'unknown')
+        }
+    
+    def _doc_cache_path(self, text: str) -> Path:
+        """Cache file for the processed Doc of a text, keyed by model, disabled components and content hash."""
+        digest = hashlib.blake2b(self._cache_salt, digest_size=16)
+        digest.update(text.encode('utf-8'))
+        return self.cache_dir / f"{digest.hexdigest()}.spacy"
+    
+    def _pipe_with_cache(self, texts: Iterable[Tuple[str, Dict]], batch_size: int,
+                         n_process: int) -> Iterator[Tuple[Doc, Dict]]:
+        """
+        Like nlp.pipe(as_tuples=True), but loads cached Docs and only runs the pipeline on misses.
+        
+        Texts are looked up as they stream in. A hit goes through nlp.pipe as an
+        empty text, which keeps its place in the output order at next to no cost,
+        and its Doc is read from the cache on the way out; so nothing beyond
+        spaCy's own batches is held in memory.
+        
+        Args:
+            texts: (text, newsletter) tuples
+            batch_size: Texts per spaCy batch
+            n_process: Worker processes for spaCy
+            
+        Yields:
+            (doc, newsletter) tuples, in input order
+        """
+        def lookups():
+            for text, newsletter_data in texts:
+                cache_path = self._doc_cache_path(text)
+                hit = cache_path.exists()
+                yield ('' if hit else text), (hit, cache_path, newsletter_data)
+        
+        for doc, (hit, cache_path, newsletter_data) in self.nlp.pipe(lookups(), as_tuples=True,
+                                                                     batch_size=batch_size,
+                                                                     n_process=n_process):
+            if hit:
+                doc = next(DocBin().from_disk(cache_path).get_docs(self.nlp.vocab))
+            else:
+                DocBin(docs=[doc]).to_disk(cache_path)
+            yield doc, newsletter_data
     
     def _load_lexicon(self, lexicon_path: Path) -> Dict:
         """Load the political lexicon from JSON file."""
         try:
-            with open(lexicon_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            data = Path(lexicon_path).read_bytes()
         except FileNotFoundError:
             print(f"Warning: Lexicon file not found at {lexicon_path}, using empty lexicon")
             return {}
+        return orjson.loads(data) if orjson is not None else json.loads(data)
     
     def _setup_custom_patterns(self):
         """Setup custom spaCy patterns for political entities."""
@@ -79,8 +293,8 @@ class NewsletterNLPProcessor:
             [{"LOWER": "speaker"}, {"ENT_TYPE": "PERSON"}],
         ]
         
-        for i, pattern in enumerate(title_patterns):
-            self.matcher.add(f"POLITICAL_TITLE_{i}", [pattern])
+        # One label for all title shapes, compiled together
+        self.matcher.add("POLITICAL_TITLE", title_patterns)
     
     def process_newsletter(self, newsletter_data: Dict) -> Dict:
         """
@@ -92,32 +306,64 @@ class NewsletterNLPProcessor:
         Returns:
             Enhanced dictionary with NLP extraction results
         """
-        text = newsletter_data.get('text', '')
-        if not text:
-            return newsletter_data
-        
-        # Process text with spaCy
-        doc = self.nlp(text)
-        
-        # Extract entities
-        entities = self.entity_extractor.extract_entities(doc)
-        
-        # Extract relationships
-        relationships = self.relationship_extractor.extract_relationships(doc, entities)
-        
-        # Analyze political context
-        context = self.context_analyzer.analyze_context(doc, entities, relationships)
+        return next(self.process_newsletters([newsletter_data]))
+    
+    def process_newsletters(self, newsletters: Iterable[Dict], batch_size: Optional[int] = None,
+                            n_process: int = 1) -> Iterator[Dict]:
+        """
+        Process many newsletters, streaming their text through nlp.pipe in batches.
         
-        # Add NLP results to newsletter data
-        newsletter_data['nlp_results'] = {
-            'entities': entities,
-            'relationships': relationships,
-            'context': context,
-            'processing_timestamp': datetime.now().isoformat(),
-            'model_version': self.nlp.meta.get('version', 'unknown')
-        }
+        Args:
+            newsletters: Iterable of dictionaries with newsletter content and metadata
+            batch_size: Texts per spaCy batch (defaults to PB_SPACY_BATCH or 64)
+            n_process: Worker processes for spaCy (default 1; batch callers opt in to more)
+            
+        Yields:
+            Enhanced dictionaries with NLP extraction results, in input order
+        """
+        if batch_size is None:
+            batch_size = int(os.environ.get('PB_SPACY_BATCH', '64'))
         
-        return newsletter_data
+        # Newsletters without text pass through untouched, but keep their place in the stream
+        texts = ((self._pipeline_text(newsletter_data), newsletter_data) for newsletter_data in newsletters)
+        if self.cache_dir is None:
+            docs = self.nlp.pipe(texts, as_tuples=True, batch_size=batch_size, n_process=n_process)
+        else:
+            docs = self._pipe_with_cache(texts, batch_size, n_process)
+        
+        for doc, newsletter_data in docs:
+            text = doc.text
+            if not text:
+                if newsletter_data.get('text'):
+                    newsletter_data['nlp_results'] = self._empty_results()
+                yield newsletter_data
+                continue
+            
+            # Only cache the lowercase text when lowercasing keeps character offsets aligned
+            doc._.raw_text = text
+            lower_text = text.lower()
+            if len(lower_text) == len(text):
+                doc._.lower_text = lower_text
+            
+            # Extract entities
+            entities = self.entity_extractor.extract_entities(doc)
+            
+            # Extract relationships
+            relationships = self.relationship_extractor.extract_relationships(doc, entities)
+            
+            # Analyze political context
+            context = self.context_analyzer.analyze_context(doc, entities, relationships)
+            
+            # Add NLP results to newsletter data
+            newsletter_data['nlp_results'] = {
+                'entities': entities,
+                'relationships': relationships,
+                'context': context,
+                'processing_timestamp': datetime.now().isoformat(),
+                'model_version': self.nlp.meta.get('version', 'unknown')
+            }
+            
+            yield newsletter_data
 
 
 class EntityExtractor:
@@ -130,8 +376,16 @@ class EntityExtractor:
         # Political titles and roles
         self.political_titles = self._get_political_titles()
         self.government_orgs = self._get_government_organizations()
+        
+        # One matcher pass per context window instead of a substring scan per title
+        self.title_matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+        for title in self.political_titles:
+            self.title_matcher.add(title, [nlp.make_doc(title)])
+        
+        # The same orgs recur across newsletters; classify each lowercased name once
+        self._classify_organization = lru_cache(maxsize=4096)(self._classify_organization)
     
-    def _get_political_titles(self) -> Set[str]:
+    def _get_political_titles(self) -> FrozenSet[str]:
         """Get set of political titles from lexicon."""
         titles = set()
         
@@ -149,9 +403,9 @@ class EntityExtractor:
         }
         titles.update(common_titles)
         
-        return titles
+        return frozenset(titles)
     
-    def _get_government_organizations(self) -> Set[str]:
+    def _get_government_organizations(self) -> FrozenSet[str]:
         """Get set of government organizations from lexicon."""
         orgs = set()
         
@@ -168,7 +422,7 @@ class EntityExtractor:
                     orgs.add(acronym_data.get('expansion', '').lower())
                     orgs.add(acronym_data.get('acronym', '').lower())
         
-        return orgs
+        return frozenset(orgs)
     
     def extract_entities(self, doc: Doc) -> Dict[str, List[Dict]]:
         """
@@ -188,14 +442,11 @@ class EntityExtractor:
             'policies': []
         }
         
-        # Extract persons with political context
-        entities['persons'] = self._extract_persons(doc)
-        
-        # Extract organizations
-        entities['organizations'] = self._extract_organizations(doc)
-        
-        # Extract locations
-        entities['locations'] = self._extract_locations(doc)
+        # Extract persons with political context, organizations and locations in one pass
+        persons, organizations, locations = self._extract_labeled_entities(doc)
+        entities['persons'] = persons
+        entities['organizations'] = organizations
+        entities['locations'] = locations
         
         # Extract political events
         entities['events'] = self._extract_events(doc)
@@ -205,21 +456,39 @@ class EntityExtractor:
         
         return entities
     
-    def _extract_persons(self, doc: Doc) -> List[Dict]:
-        """Extract person entities with political roles and titles."""
+    def _extract_labeled_entities(self, doc: Doc) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """Extract persons, organizations and locations from a single pass over doc.ents."""
         persons = []
-        seen_names = set()
+        organizations = []
+        locations = []
+        seen = set()
+        title_matches = None
         
         for ent in doc.ents:
-            if ent.label_ == "PERSON":
-                name = ent.text.strip()
-                if name.lower() in seen_names or len(name) < 3:
-                    continue
-                
-                # Look for titles in surrounding context
-                title, party, state = self._extract_person_context(doc, ent)
+            label = ent.label_
+            if label == "PERSON":
+                kind = "PERSON"
+            elif label == "ORG":
+                kind = "ORG"
+            elif label in ("GPE", "LOC"):
+                kind = "LOCATION"
+            else:
+                continue
+            
+            # Names recur heavily across a corpus; interning shares one copy of each
+            name = sys.intern(ent.text.strip())
+            name_lower = sys.intern(name.lower())
+            if (kind, name_lower) in seen or len(name) < 3:
+                continue
+            seen.add((kind, name_lower))
+            
+            if kind == "PERSON":
+                # Look for titles in surrounding context; match titles once per doc
+                if title_matches is None:
+                    title_matches = self._match_titles(doc)
+                title, party, state = self._extract_person_context(doc, ent, title_matches)
                 
-                person_data = {
+                persons.append({
                     'name': name,
                     'titles': title if title else [],
                     'party': party,
@@ -227,15 +496,53 @@ class EntityExtractor:
                     'start_char': ent.start_char,
                     'end_char': ent.end_char,
                     'confidence': 0.9 if title else 0.7
-                }
-                
-                persons.append(person_data)
-                seen_names.add(name.lower())
+                })
+            elif kind == "ORG":
+                organizations.append({
+                    'name': name,
+                    'type': self._classify_organization(name_lower),
+                    'start_char': ent.start_char,
+                    'end_char': ent.end_char,
+                    'confidence': 0.8
+                })
+            else:
+                locations.append({
+                    'name': name,
+                    'type': label,
+                    'start_char': ent.start_char,
+                    'end_char': ent.end_char,
+                    'confidence': 0.8
+                })
         
-        return persons
+        return persons, organizations, locations
+    
+    def _extract_persons(self, doc: Doc) -> List[Dict]:
+        """Extract person entities with political roles and titles."""
+        return self._extract_labeled_entities(doc)[0]
+    
+    def _extract_organizations(self, doc: Doc) -> List[Dict]:
+        """Extract organization entities."""
+        return self._extract_labeled_entities(doc)[1]
     
-    def _extract_person_context(self, doc: Doc, person_ent: Span) -> Tuple[List[str], Optional[str], Optional[str]]:
-        """Extract title, party, and state for a person entity."""
+    def _extract_locations(self, doc: Doc) -> List[Dict]:
+        """Extract location entities relevant to political context."""
+        return self._extract_labeled_entities(doc)[2]
+    
+    def _match_titles(self, doc: Doc) -> List[Tuple[int, int, int]]:
+        """Run the title matcher over the whole doc, ordered by start token."""
+        return sorted(self.title_matcher(doc), key=itemgetter(1, 2))
+    
+    def _extract_person_context(self, doc: Doc, person_ent: Span,
+                                title_matches: Optional[List[Tuple[int, int, int]]] = None
+                                ) -> Tuple[List[str], Optional[str], Optional[str]]:
+        """
+        Extract title, party, and state for a person entity.
+        
+        Args:
+            doc: spaCy processed document
+            person_ent: The PERSON entity span
+            title_matches: _match_titles output for the doc, shared across its persons
+        """
         titles = []
         party = None
         state = None
@@ -243,24 +550,32 @@ class EntityExtractor:
         # Look in surrounding 10 tokens before and after
         start_idx = max(0, person_ent.start - 10)
         end_idx = min(len(doc), person_ent.end + 10)
-        context = doc[start_idx:end_idx]
         
-        context_text = context.text.lower()
-        
-        # Extract titles
-        for title in self.political_titles:
-            if title in context_text:
-                titles.append(title.title())
+        # Slice the window straight out of the cached lowercase text
+        last = doc[end_idx - 1]
+        start_char, end_char = doc[start_idx].idx, last.idx + len(last)
+        lower_text = doc._.lower_text
+        if lower_text is not None:
+            context_text = lower_text[start_char:end_char]
+        else:
+            context_text = doc[start_idx:end_idx].text.lower()
+        
+        # Extract titles fully inside the window, once each in order of appearance
+        if title_matches is None:
+            title_matches = self._match_titles(doc)
+        strings = self.nlp.vocab.strings
+        window_titles = {}
+        for match_id, start, end in title_matches[bisect_left(title_matches, start_idx, key=itemgetter(1)):]:
+            if start >= end_idx:
+                break
+            if end <= end_idx:
+                window_titles[match_id] = None
+        for match_id in window_titles:
+            titles.append(strings[match_id].title())
         
         # Extract party affiliation
-        party_patterns = [
-            r'\(([DR])-([A-Z]{2})\)',  # (D-NY) or (R-TX)
-            r'democrat(?:ic)?',
-            r'republican'
-        ]
-        
-        for pattern in party_patterns:
-            match = re.search(pattern, context_text, re.IGNORECASE)
+        for pattern in _PARTY_PATTERNS:
+            match = pattern.search(context_text)
             if match:
                 if match.group(0).startswith('('):
                     party = 'Democratic' if match.group(1) == 'D' else 'Republican'
@@ -271,32 +586,6 @@ class EntityExtractor:
         
         return titles, party, state
     
-    def _extract_organizations(self, doc: Doc) -> List[Dict]:
-        """Extract organization entities."""
-        organizations = []
-        seen_orgs = set()
-        
-        for ent in doc.ents:
-            if ent.label_ == "ORG":
-                name = ent.text.strip()
-                if name.lower() in seen_orgs or len(name) < 3:
-                    continue
-                
-                org_type = self._classify_organization(name)
-                
-                org_data = {
-                    'name': name,
-                    'type': org_type,
-                    'start_char': ent.start_char,
-                    'end_char': ent.end_char,
-                    'confidence': 0.8
-                }
-                
-                organizations.append(org_data)
-                seen_orgs.add(name.lower())
-        
-        return organizations
-    
     def _classify_organization(self, org_name: str) -> str:
         """Classify organization type based on name and lexicon."""
         org_lower = org_name.lower()
@@ -305,94 +594,36 @@ class EntityExtractor:
         if org_lower in self.government_orgs:
             return 'government'
         
-        # Pattern-based classification
-        government_keywords = [
-            'committee', 'department', 'agency', 'bureau', 'service',
-            'administration', 'commission', 'board', 'office', 'court'
-        ]
-        
-        political_keywords = [
-            'party', 'democratic', 'republican', 'pac', 'campaign',
-            'committee', 'caucus'
-        ]
-        
-        for keyword in government_keywords:
-            if keyword in org_lower:
-                return 'government'
-        
-        for keyword in political_keywords:
-            if keyword in org_lower:
-                return 'political'
+        # Pattern-based classification, in priority order
+        for org_type, pattern in _ORG_TYPE_PATTERNS:
+            if pattern.search(org_lower):
+                return org_type
         
         return 'other'
     
-    def _extract_locations(self, doc: Doc) -> List[Dict]:
-        """Extract location entities relevant to political context."""
-        locations = []
-        seen_locations = set()
-        
-        for ent in doc.ents:
-            if ent.label_ in ["GPE", "LOC"]:
-                name = ent.text.strip()
-                if name.lower() in seen_locations or len(name) < 3:
-                    continue
-                
-                location_data = {
-                    'name': name,
-                    'type': ent.label_,
-                    'start_char': ent.start_char,
-                    'end_char': ent.end_char,
-                    'confidence': 0.8
-                }
-                
-                locations.append(location_data)
-                seen_locations.add(name.lower())
-        
-        return locations
-    
     def _extract_events(self, doc: Doc) -> List[Dict]:
         """Extract political events like meetings, hearings, votes."""
         events = []
         
-        # Event keywords and patterns
-        event_patterns = [
-            (r'meeting\s+(?:with|between)', 'meeting'),
-            (r'hearing\s+on', 'hearing'),
-            (r'vote\s+on', 'vote'),
-            (r'confirmation\s+of', 'confirmation'),
-            (r'nomination\s+of', 'nomination'),
-            (r'appointment\s+of', 'appointment'),
-            (r'resignation\s+of', 'resignation')
-        ]
-        
-        for pattern, event_type in event_patterns:
-            for match in re.finditer(pattern, doc.text, re.IGNORECASE):
-                event_data = {
-                    'type': event_type,
-                    'text': match.group(0),
-                    'start_char': match.start(),
-                    'end_char': match.end(),
-                    'confidence': 0.7
-                }
-                events.append(event_data)
+        for match in _EVENT_RE.finditer(_doc_text(doc)):
+            event_data = {
+                'type': match.lastgroup,
+                'text': match.group(0),
+                'start_char': match.start(),
+                'end_char': match.end(),
+                'confidence': 0.7
+            }
+            events.append(event_data)
         
         return events
     
     def _extract_policies(self, doc: Doc) -> List[Dict]:
         """Extract policy and legislative mentions."""
         policies = []
+        text = _doc_text(doc)
         
-        # Policy keywords and patterns
-        policy_patterns = [
-            (r'(?:bill|legislation|act|amendment)\s+[A-Z0-9-]+', 'legislation'),
-            (r'(?:budget|spending|funding|appropriations)', 'fiscal'),
-            (r'(?:tariff|trade|import|export)', 'trade'),
-            (r'(?:healthcare|health\s+care|medicaid|medicare)', 'healthcare'),
-            (r'(?:climate|environment|energy)', 'environment')
-        ]
-        
-        for pattern, policy_type in policy_patterns:
-            for match in re.finditer(pattern, doc.text, re.IGNORECASE):
+        for pattern, policy_type in _POLICY_PATTERNS:
+            for match in pattern.finditer(text):
                 policy_data = {
                     'type': policy_type,
                     'text': match.group(0),
@@ -442,16 +673,13 @@ class RelationshipExtractor:
     def _extract_meetings(self, doc: Doc, entities: Dict) -> List[Dict]:
         """Extract meeting relationships."""
         relationships = []
+        text = _doc_text(doc)
         
-        meeting_patterns = [
-            r'(\w+(?:\s+\w+)*?)\s+(?:met|meeting|meets)\s+with\s+(\w+(?:\s+\w+)*?)(?:\s|$|\.)',
-            r'(\w+(?:\s+\w+)*?)\s+and\s+(\w+(?:\s+\w+)*?)\s+(?:met|meeting)(?:\s|$|\.)',
-        ]
-        
-        for pattern in meeting_patterns:
-            for match in re.finditer(pattern, doc.text, re.IGNORECASE):
-                subject = match.group(1).strip()
-                object_entity = match.group(2).strip() if len(match.groups()) > 1 else None
+        for pattern in _MEETING_PATTERNS:
+            for match in pattern.finditer(text):
+                subject, object_entity = match.group(1, 2)
+                subject = subject.strip()
+                object_entity = object_entity.strip()
                 
                 if subject and object_entity:
                     relationship = {
@@ -470,16 +698,13 @@ class RelationshipExtractor:
     def _extract_appointments(self, doc: Doc, entities: Dict) -> List[Dict]:
         """Extract appointment and nomination relationships."""
         relationships = []
+        text = _doc_text(doc)
         
-        appointment_patterns = [
-            r'(\w+(?:\s+\w+)*?)\s+(?:nominated|appointed|named)\s+(\w+(?:\s+\w+)*?)\s+(?:as|for|to)',
-            r'(\w+(?:\s+\w+)*?)\s+(?:confirmed|approved)\s+(?:as|for|to)\s+(\w+(?:\s+\w+)*?)',
-        ]
-        
-        for pattern in appointment_patterns:
-            for match in re.finditer(pattern, doc.text, re.IGNORECASE):
-                subject = match.group(1).strip()
-                position = match.group(2).strip() if len(match.groups()) > 1 else None
+        for pattern in _APPOINTMENT_PATTERNS:
+            for match in pattern.finditer(text):
+                subject, position = match.group(1, 2)
+                subject = subject.strip()
+                position = position.strip()
                 
                 if subject and position:
                     relationship = {
@@ -498,26 +723,25 @@ class RelationshipExtractor:
     def _extract_policy_positions(self, doc: Doc, entities: Dict) -> List[Dict]:
         """Extract policy position relationships."""
         relationships = []
+        text = _doc_text(doc)
         
-        position_patterns = [
-            r'(\w+(?:\s+\w+)*?)\s+(?:supports|opposes|backs|endorses)\s+(\w+(?:\s+\w+)*?)(?:\s|$|\.)',
-            r'(\w+(?:\s+\w+)*?)\s+(?:voted|votes)\s+(?:for|against)\s+(\w+(?:\s+\w+)*?)(?:\s|$|\.)',
-        ]
-        
-        for pattern in position_patterns:
-            for match in re.finditer(pattern, doc.text, re.IGNORECASE):
-                subject = match.group(1).strip()
-                policy = match.group(2).strip() if len(match.groups()) > 1 else None
+        for pattern in _POSITION_PATTERNS:
+            for match in pattern.finditer(text):
+                subject, policy = match.group(1, 2)
+                subject = subject.strip()
+                policy = policy.strip()
                 
                 if subject and policy:
-                    predicate = 'supports' if any(word in match.group(0).lower() 
-                                                for word in ['supports', 'backs', 'endorses', 'for']) else 'opposes'
+                    context = match.group(0)
+                    context_lower = context.lower()
+                    predicate = 'supports' if any(word in context_lower 
+                                                for word in ('supports', 'backs', 'endorses', 'for')) else 'opposes'
                     
                     relationship = {
                         'subject': subject,
                         'predicate': predicate,
                         'object': policy,
-                        'context': match.group(0),
+                        'context': context,
                         'start_char': match.start(),
                         'end_char': match.end(),
                         'confidence': 0.7
@@ -529,16 +753,13 @@ class RelationshipExtractor:
     def _extract_communications(self, doc: Doc, entities: Dict) -> List[Dict]:
         """Extract communication relationships."""
         relationships = []
+        text = _doc_text(doc)
         
-        communication_patterns = [
-            r'(\w+(?:\s+\w+)*?)\s+(?:told|said\s+to|wrote\s+to)\s+(\w+(?:\s+\w+)*?)(?:\s|$|\.)',
-            r'(\w+(?:\s+\w+)*?)\s+and\s+(\w+(?:\s+\w+)*?)\s+(?:discussed|talked\s+about)(?:\s|$|\.)',
-        ]
-        
-        for pattern in communication_patterns:
-            for match in re.finditer(pattern, doc.text, re.IGNORECASE):
-                subject = match.group(1).strip()
-                object_entity = match.group(2).strip() if len(match.groups()) > 1 else None
+        for pattern in _COMMUNICATION_PATTERNS:
+            for match in pattern.finditer(text):
+                subject, object_entity = match.group(1, 2)
+                subject = subject.strip()
+                object_entity = object_entity.strip()
                 
                 if subject and object_entity:
                     relationship = {
@@ -574,47 +795,29 @@ class PoliticalContextAnalyzer:
         Returns:
             Context analysis results
         """
+        # Lowercase once; the keyword checks below are plain substring tests on it
+        doc_text = doc._.lower_text or _doc_text(doc).lower()
+        
         context = {
-            'main_topics': self._identify_main_topics(doc, entities),
-            'sentiment': self._analyze_sentiment(doc),
+            'main_topics': self._identify_main_topics(doc_text, entities),
+            'sentiment': self._analyze_sentiment(doc_text),
             'key_figures': self._identify_key_figures(entities, relationships),
             'political_events': self._categorize_events(entities.get('events', [])),
-            'urgency_indicators': self._detect_urgency(doc)
+            'urgency_indicators': self._detect_urgency(doc_text)
         }
         
         return context
     
-    def _identify_main_topics(self, doc: Doc, entities: Dict) -> List[str]:
-        """Identify main political topics in the newsletter."""
-        topics = []
-        
-        # Topic keywords
-        topic_keywords = {
-            'budget': ['budget', 'spending', 'appropriations', 'funding'],
-            'nominations': ['nominee', 'confirmation', 'appointment'],
-            'legislation': ['bill', 'vote', 'committee', 'markup'],
-            'foreign_policy': ['international', 'foreign', 'diplomacy', 'trade'],
-            'elections': ['campaign', 'election', 'polling', 'candidate']
-        }
-        
-        doc_text = doc.text.lower()
-        
-        for topic, keywords in topic_keywords.items():
-            if any(keyword in doc_text for keyword in keywords):
-                topics.append(topic)
-        
-        return topics
+    def _identify_main_topics(self, doc_text: str, entities: Dict) -> List[str]:
+        """Identify main political topics in the lowercased newsletter text."""
+        return [topic for topic, topic_words in TOPIC_KEYWORDS.items()
+                if any(keyword in doc_text for keyword in topic_words)]
     
-    def _analyze_sentiment(self, doc: Doc) -> str:
-        """Basic sentiment analysis of the newsletter."""
+    def _analyze_sentiment(self, doc_text: str) -> str:
+        """Basic sentiment analysis of the lowercased newsletter text."""
         # Simple keyword-based sentiment
-        positive_words = ['success', 'agreement', 'progress', 'support', 'approval']
-        negative_words = ['crisis', 'failure', 'oppose', 'controversy', 'scandal']
-        
-        doc_text = doc.text.lower()
-        
-        positive_count = sum(1 for word in positive_words if word in doc_text)
-        negative_count = sum(1 for word in negative_words if word in doc_text)
+        positive_count = sum(1 for word in POSITIVE_WORDS if word in doc_text)
+        negative_count = sum(1 for word in NEGATIVE_WORDS if word in doc_text)
         
         if positive_count > negative_count:
             return 'positive'
@@ -625,23 +828,16 @@ class PoliticalContextAnalyzer:
     
     def _identify_key_figures(self, entities: Dict, relationships: List[Dict]) -> List[str]:
         """Identify the most important political figures mentioned."""
-        person_mentions = {}
-        
         # Count person mentions
-        for person in entities.get('persons', []):
-            name = person['name']
-            person_mentions[name] = person_mentions.get(name, 0) + 1
+        person_mentions = Counter(person['name'] for person in entities.get('persons', []))
         
         # Weight by relationship involvement
         for rel in relationships:
-            subject = rel.get('subject', '')
-            obj = rel.get('object', '')
-            
-            person_mentions[subject] = person_mentions.get(subject, 0) + 2
-            person_mentions[obj] = person_mentions.get(obj, 0) + 1
+            person_mentions[rel.get('subject', '')] += 2
+            person_mentions[rel.get('object', '')] += 1
         
-        # Return top mentioned figures
-        return sorted(person_mentions.keys(), key=person_mentions.get, reverse=True)[:5]
+        # Return top mentioned figures (ties keep first-seen order, as with a stable sort)
+        return [name for name, _ in heapq.nlargest(5, person_mentions.items(), key=itemgetter(1))]
     
     def _categorize_events(self, events: List[Dict]) -> Dict[str, int]:
         """Categorize political events by type."""
@@ -653,18 +849,61 @@ class PoliticalContextAnalyzer:
         
         return event_counts
     
-    def _detect_urgency(self, doc: Doc) -> List[str]:
-        """Detect urgency indicators in the text."""
-        urgency_patterns = [
-            'breaking', 'urgent', 'immediately', 'crisis', 'emergency',
-            'deadline', 'last minute', 'rushed', 'pressure'
-        ]
-        
-        doc_text = doc.text.lower()
-        found_indicators = []
-        
-        for indicator in urgency_patterns:
-            if indicator in doc_text:
-                found_indicators.append(indicator)
-        
-        return found_indicators
\ No newline at end of file
+    def _detect_urgency(self, doc_text: str) -> List[str]:
+        """Detect urgency indicators in the lowercased text."""
+        return [indicator for indicator in URGENCY_INDICATORS if indicator in doc_text]
+
+
+# Per-process processor for process_corpus workers, loaded once by _init_worker
+_worker_processor = None
+
+
+def _init_worker(model_name: str, lexicon_path: Optional[str]):
+    """Load the spaCy model and lexicon once in each worker process."""
+    global _worker_processor
+    _worker_processor = NewsletterNLPProcessor(model_name, lexicon_path)
+
+
+def _process_batch(newsletters: List[Dict]) -> List[Dict]:
+    """Run one batch of newsletters through the worker's processor."""
+    return list(_worker_processor.process_newsletters(newsletters, batch_size=len(newsletters), n_process=1))
+
+
+def _batched(items: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    """Split an iterable into lists of at most size items."""
+    items = iter(items)
+    while True:
+        batch = list(islice(items, size))
+        if not batch:
+            return
+        yield batch
+
+
+def process_corpus(newsletters: Iterable[Dict], model_name: str = "en_core_web_lg",
+                   lexicon_path: Optional[str] = None, workers: Optional[int] = None,
+                   batch_size: int = 64) -> Iterator[Dict]:
+    """
+    Process a large corpus across worker processes that each keep a loaded model.
+    
+    Args:
+        newsletters: Iterable of dictionaries with newsletter content and metadata
+        model_name: spaCy model to use
+        lexicon_path: Path to political lexicon JSON file
+        workers: Number of worker processes (defaults to CPU count; 1 runs in-process)
+        batch_size: Newsletters handed to a worker at a time
+        
+    Yields:
+        Enhanced dictionaries with NLP extraction results, in input order
+    """
+    workers = workers or os.cpu_count() or 1
+    batches = _batched(newsletters, batch_size)
+    
+    if workers == 1:
+        processor = NewsletterNLPProcessor(model_name, lexicon_path)
+        for batch in batches:
+            yield from processor.process_newsletters(batch, batch_size=batch_size, n_process=1)
+        return
+    
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(model_name, lexicon_path)) as pool:
+        for results in pool.imap(_process_batch, batches):
+            yield from results
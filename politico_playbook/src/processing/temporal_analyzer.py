@@ -10,16 +10,87 @@ Input: Normalized entities with temporal context from Stage 3
 Output: Graph nodes/edges, time series data, political intelligence reports
 """
 
+import os
+import re
+import csv
+import sys
 import json
+import hashlib
+import pickle
+import warnings
 import pandas as pd
 import numpy as np
 from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Any
-from dataclasses import dataclass, asdict
+from typing import Any, BinaryIO, Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, fields
 from collections import defaultdict, Counter
+from functools import lru_cache
 import networkx as nx
 from itertools import combinations
+from multiprocessing.pool import ThreadPool
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib decoder
+    orjson = None
+
+try:
+    import igraph as ig
+except ImportError:  # optional C backend; NetworkX is used when missing
+    ig = None
+
+
+# Low-cardinality time series columns, kept as pandas categoricals
+CATEGORICAL_TIME_SERIES_COLUMNS = ('date', 'entity_id', 'entity_name', 'activity_type', 'newsletter_id')
+
+
+# Title patterns for political officials, checked in priority order
+_ROLE_ACTIVITY_PATTERNS = (
+    (re.compile(r'president'), 'executive_activity'),
+    (re.compile(r'senator|representative'), 'legislative_activity'),
+    (re.compile(r'secretary|director|administrator'), 'administrative_activity'),
+)
+
+_CATEGORY_ACTIVITY_TYPES = {
+    'journalist': 'media_activity',
+    'staff': 'staff_activity',
+    'political_staff': 'staff_activity',
+    'lobbyist': 'lobbying_activity',
+}
+
+
+@lru_cache(maxsize=4096)
+def _activity_type(category: str, role: str) -> str:
+    """Activity type for a person's category and role; the same pairs recur in every newsletter."""
+    if category != 'political_official':
+        return _CATEGORY_ACTIVITY_TYPES.get(category, 'general_activity')
+    
+    role = role.lower()
+    for pattern, activity_type in _ROLE_ACTIVITY_PATTERNS:
+        if pattern.search(role):
+            return activity_type
+    return 'political_activity'
+
+
+# 1 MiB write buffers so large exports reach the OS in a few big writes
+EXPORT_BUFFER_SIZE = 1 << 20
+
+
+def _detect_gpu_backend() -> Dict[str, str]:
+    """NetworkX dispatch kwargs for cuGraph when nx-cugraph and a CUDA device are present."""
+    try:
+        import cupy
+        import nx_cugraph  # noqa: F401  registers the 'cugraph' backend
+        if cupy.cuda.runtime.getDeviceCount() > 0:
+            return {'backend': 'cugraph'}
+    except Exception:
+        pass
+    return {}
+
+
+# Empty on CPU-only hosts, so the NetworkX calls below dispatch as usual
+NX_GPU_BACKEND = _detect_gpu_backend()
 
 
 @dataclass
@@ -90,6 +161,39 @@ class InfluenceNetwork:
     network_evolution: List[Dict]  # Snapshots over time
 
 
+@dataclass
+class NewsletterView:
+    """Flat view of one Stage 3 newsletter, so the collectors skip the nested lookups."""
+    newsletter_id: str
+    date: str
+    people: List[Dict]
+    organizations: List[Dict]
+    stories: List[Dict]
+    relationships: List[Dict]
+    
+    @classmethod
+    def from_newsletter(cls, newsletter: Dict) -> 'NewsletterView':
+        """Pull the fields every collector reads out of a normalized newsletter dict."""
+        normalized_results = newsletter.get('database_normalized_results') or {}
+        
+        # Names and ids repeat across every newsletter; share one string object per value
+        for section, id_key in (('people', 'entity_id'), ('organizations', 'organization_id')):
+            for entity in normalized_results.get(section) or []:
+                for key in (id_key, 'canonical_name'):
+                    value = entity.get(key)
+                    if type(value) is str:
+                        entity[key] = sys.intern(value)
+        
+        return cls(
+            newsletter_id=newsletter.get('file_name', 'unknown'),
+            date=(normalized_results.get('processing_info') or {}).get('newsletter_date', ''),
+            people=normalized_results.get('people') or [],
+            organizations=normalized_results.get('organizations') or [],
+            stories=normalized_results.get('stories_and_topics') or [],
+            relationships=normalized_results.get('relationships') or []
+        )
+
+
 class TemporalAnalyzer:
     """
     Stage 4 processor: Create graph and time series analysis from normalized data.
@@ -102,8 +206,24 @@ class TemporalAnalyzer:
     5. Create visualization-ready data exports
     """
     
-    def __init__(self):
-        """Initialize the temporal analyzer."""
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize the temporal analyzer.
+        
+        Args:
+            cache_dir: Directory for pickled centralities and time series, so reruns
+                over an unchanged graph or input set skip recomputing them
+        """
+        
+        # Optional on-disk memoization of the expensive analysis steps
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._input_key = None  # fingerprint of the loaded input files
+        
+        # Per-pass aggregates filled while streaming the input files
+        self._edge_agg = {}  # (entity_id, entity_id) -> [subject, object, weight, count, type, first, last]
+        self._time_series_columns = None  # TimeSeriesPoint field -> values
         
         # Network analysis
         self.political_graph = nx.Graph()
@@ -117,7 +237,7 @@ class TemporalAnalyzer:
         # Analysis results
         self.influence_networks = {}
         self.political_trends = {}
-        self.time_series_data = []
+        self.time_series_df = pd.DataFrame(columns=[f.name for f in fields(TimeSeriesPoint)])
         
         # Processing statistics
         self.processing_stats = {
@@ -128,37 +248,62 @@ class TemporalAnalyzer:
             'time_periods_covered': 0
         }
     
-    def process_newsletter_batch(self, input_dir: Path) -> Dict:
+    def process_newsletter_batch(self, input_dir: Path, workers: Optional[int] = None) -> Dict:
         """
         Stage 4: Process batch of normalized newsletters for temporal analysis.
         
         Args:
             input_dir: Directory containing Stage 3 normalized newsletters
+            workers: Threads used to read and decode the input files (default: cpu_count + 4, max 32)
             
         Returns:
             Comprehensive temporal analysis results
         """
         print(f"📈 Stage 4: Building temporal analysis from normalized data")
         
-        # Load all normalized newsletters
         normalized_files = list(input_dir.glob("normalized_*.json"))
-        newsletters_data = []
         
-        for file_path in normalized_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    newsletter = json.load(f)
-                    if 'database_normalized_results' in newsletter:
-                        newsletters_data.append(newsletter)
-            except Exception as e:
-                print(f"⚠️ Error loading {file_path}: {e}")
+        if self.cache_dir is not None:
+            digest = hashlib.blake2b(digest_size=16)
+            for file_path in sorted(normalized_files):
+                stat = file_path.stat()
+                digest.update(f"{file_path.name}:{stat.st_mtime_ns}:{stat.st_size};".encode('utf-8'))
+            self._input_key = digest.hexdigest()
         
-        print(f"📊 Loaded {len(newsletters_data)} normalized newsletters for analysis")
+        # Time series columns are only collected when no cached frame matches the inputs
+        self._edge_agg = {}
+        self._time_series_columns = None if self._load_cached_time_series() else {
+            field.name: [] for field in fields(TimeSeriesPoint)
+        }
+        
+        # Stream the newsletters: each one is decoded once, fed to every collector and
+        # dropped, so memory holds the aggregates rather than the whole corpus.
+        # Files are independent, so reads and decoding overlap across threads.
+        workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        pool = None
+        if workers > 1 and len(normalized_files) > 1:
+            pool = ThreadPool(min(workers, len(normalized_files)))
+            loaded = pool.imap(_load_normalized_newsletter, normalized_files, chunksize=4)
+        else:
+            loaded = map(_load_normalized_newsletter, normalized_files)
+        
+        newsletter_count = 0
+        try:
+            for view in loaded:
+                if view is not None:
+                    self._collect_newsletter(view)
+                    newsletter_count += 1
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        
+        print(f"📊 Loaded {newsletter_count} normalized newsletters for analysis")
+        print(f"  📋 Registry built: {len(self.entity_registry)} unique entities")
         
         # Build comprehensive temporal analysis
-        self._build_entity_registry(newsletters_data)
-        self._build_political_graph(newsletters_data)
-        self._generate_time_series_data(newsletters_data)
+        self._build_political_graph()
+        self._generate_time_series_data()
         self._analyze_influence_networks()
         self._identify_political_trends()
         
@@ -168,72 +313,122 @@ class TemporalAnalyzer:
         print(f"📈 Stage 4 analysis complete:")
         print(f"  Graph nodes: {len(self.political_graph.nodes)}")
         print(f"  Graph edges: {len(self.political_graph.edges)}")
-        print(f"  Time series points: {len(self.time_series_data)}")
+        print(f"  Time series points: {len(self.time_series_df)}")
         print(f"  Political trends: {len(self.political_trends)}")
         print(f"  Influence networks: {len(self.influence_networks)}")
         
         return analysis_results
     
-    def _build_entity_registry(self, newsletters_data: List[Dict]) -> None:
-        """Build comprehensive entity registry from normalized data."""
-        print("🗂️ Building entity registry...")
+    def _collect_newsletter(self, view: NewsletterView) -> None:
+        """Feed one normalized newsletter to the entity, relationship and time series collectors."""
+        self._collect_entities(view)
+        self._collect_relationships(view)
+        if self._time_series_columns is not None:
+            self._collect_time_series(view)
+    
+    def _collect_entities(self, view: NewsletterView) -> None:
+        """Add a newsletter's people, organizations and stories to the entity registry."""
+        # Process people
+        for person in view.people:
+            self._record_appearance(person.get('entity_id'), 'person', person, view.date)
         
-        for newsletter in newsletters_data:
-            normalized_results = newsletter.get('database_normalized_results', {})
-            newsletter_date = normalized_results.get('processing_info', {}).get('newsletter_date', '')
-            
-            # Process people
-            for person in normalized_results.get('people', []):
-                entity_id = person.get('entity_id')
-                if entity_id:
-                    if entity_id not in self.entity_registry:
-                        self.entity_registry[entity_id] = {
-                            'type': 'person',
-                            'data': person,
-                            'activity_dates': [],
-                            'relationships': [],
-                            'influence_score': 0.0
-                        }
-                    
-                    self.entity_registry[entity_id]['activity_dates'].append(newsletter_date)
+        # Process organizations  
+        for org in view.organizations:
+            self._record_appearance(org.get('organization_id'), 'organization', org, view.date)
+        
+        # Process stories
+        for story in view.stories:
+            self._record_appearance(story.get('story_id'), 'story', story, view.date)
+    
+    def _record_appearance(self, entity_id: Optional[str], entity_type: str, data: Dict,
+                           newsletter_date: str) -> None:
+        """Register an entity on first sight and fold the newsletter date into its activity summary."""
+        if not entity_id:
+            return
+        
+        entity_info = self.entity_registry.get(entity_id)
+        if entity_info is None:
+            self.entity_registry[entity_id] = {
+                'type': entity_type,
+                'data': data,
+                'first_date': newsletter_date,
+                'last_date': newsletter_date,
+                'appearance_count': 1,
+                'relationships': [],
+                'influence_score': 0.0
+            }
+            return
+        
+        # Only the count and date range are ever reported, so no per-mention list is kept
+        entity_info['appearance_count'] += 1
+        if newsletter_date < entity_info['first_date']:
+            entity_info['first_date'] = newsletter_date
+        if newsletter_date > entity_info['last_date']:
+            entity_info['last_date'] = newsletter_date
+    
+    def _collect_relationships(self, view: NewsletterView) -> None:
+        """
+        Aggregate a newsletter's relationships per undirected entity pair.
+        
+        The first observation fixes the edge orientation and its type/first/last
+        attributes. Pairs are checked against the registry once it is complete,
+        in _build_political_graph.
+        """
+        for relationship in view.relationships:
+            subject_id = relationship.get('subject_entity_id')
+            object_id = relationship.get('object_entity_id')
             
-            # Process organizations  
-            for org in normalized_results.get('organizations', []):
-                entity_id = org.get('organization_id')
-                if entity_id:
-                    if entity_id not in self.entity_registry:
-                        self.entity_registry[entity_id] = {
-                            'type': 'organization', 
-                            'data': org,
-                            'activity_dates': [],
-                            'relationships': [],
-                            'influence_score': 0.0
-                        }
-                    
-                    self.entity_registry[entity_id]['activity_dates'].append(newsletter_date)
+            if subject_id and object_id:
+                # Calculate relationship strength
+                strength = relationship.get('confidence_average', 0.0) * relationship.get('observation_count', 1)
+                
+                key = (subject_id, object_id) if subject_id <= object_id else (object_id, subject_id)
+                edge = self._edge_agg.get(key)
+                if edge is not None:
+                    edge[2] += strength
+                    edge[3] += 1
+                else:
+                    self._edge_agg[key] = [subject_id, object_id, strength, 1,
+                                           relationship.get('relationship_type', 'interaction'),
+                                           relationship.get('first_observed'),
+                                           relationship.get('last_observed')]
+    
+    def _collect_time_series(self, view: NewsletterView) -> None:
+        """Append a newsletter's people and organization activity to the time series columns."""
+        columns = self._time_series_columns
+        newsletter_id, newsletter_date = view.newsletter_id, view.date
+        
+        # Create time series points for people activities
+        for person in view.people:
+            # Calculate activity intensity based on mention frequency and context
+            base_intensity = person.get('confidence_average', 0.0)
+            mention_boost = min(person.get('mention_count', 1) / 5.0, 1.0)  # Cap at 1.0
             
-            # Process stories
-            for story in normalized_results.get('stories_and_topics', []):
-                entity_id = story.get('story_id')
-                if entity_id:
-                    if entity_id not in self.entity_registry:
-                        self.entity_registry[entity_id] = {
-                            'type': 'story',
-                            'data': story,
-                            'activity_dates': [],
-                            'relationships': [],
-                            'influence_score': 0.0
-                        }
-                    
-                    self.entity_registry[entity_id]['activity_dates'].append(newsletter_date)
+            columns['date'].append(newsletter_date)
+            columns['entity_id'].append(person.get('entity_id', ''))
+            columns['entity_name'].append(person.get('canonical_name', 'Unknown'))
+            # Determine activity type based on person's role/category
+            columns['activity_type'].append(self._classify_person_activity_type(person))
+            columns['activity_intensity'].append(base_intensity * (1 + mention_boost))
+            columns['context'].append(person.get('newsletter_appearances', [{}])[-1].get('activity', ''))
+            columns['newsletter_id'].append(newsletter_id)
         
-        print(f"  📋 Registry built: {len(self.entity_registry)} unique entities")
+        # Create time series points for organizational activities
+        for org in view.organizations:
+            columns['date'].append(newsletter_date)
+            columns['entity_id'].append(org.get('organization_id', ''))
+            columns['entity_name'].append(org.get('canonical_name', 'Unknown'))
+            columns['activity_type'].append('organizational_activity')
+            columns['activity_intensity'].append(org.get('confidence_average', 0.0))
+            columns['context'].append(org.get('newsletter_appearances', [{}])[-1].get('activity', ''))
+            columns['newsletter_id'].append(newsletter_id)
     
-    def _build_political_graph(self, newsletters_data: List[Dict]) -> None:
-        """Build political network graph from relationships."""
+    def _build_political_graph(self) -> None:
+        """Build political network graph from the registry and aggregated relationships."""
         print("🕸️ Building political network graph...")
         
         # Add nodes for all entities
+        nodes = []
         for entity_id, entity_info in self.entity_registry.items():
             entity_data = entity_info['data']
             
@@ -264,114 +459,74 @@ class TemporalAnalyzer:
                     'report_count': entity_data.get('report_count', 0)
                 }
             
-            self.political_graph.add_node(entity_id, 
-                                        label=label,
-                                        type=entity_info['type'],
-                                        category=category,
-                                        **attributes)
-        
-        # Add edges from relationships
-        for newsletter in newsletters_data:
-            normalized_results = newsletter.get('database_normalized_results', {})
-            
-            for relationship in normalized_results.get('relationships', []):
-                subject_id = relationship.get('subject_entity_id')
-                object_id = relationship.get('object_entity_id')
-                
-                if subject_id and object_id and subject_id in self.entity_registry and object_id in self.entity_registry:
-                    # Calculate relationship strength
-                    strength = relationship.get('confidence_average', 0.0) * relationship.get('observation_count', 1)
-                    
-                    # Add or update edge
-                    if self.political_graph.has_edge(subject_id, object_id):
-                        # Update existing edge
-                        edge_data = self.political_graph[subject_id][object_id]
-                        edge_data['weight'] = edge_data.get('weight', 0) + strength
-                        edge_data['interaction_count'] = edge_data.get('interaction_count', 0) + 1
-                    else:
-                        # Add new edge
-                        self.political_graph.add_edge(subject_id, object_id,
-                                                    weight=strength,
-                                                    relationship_type=relationship.get('relationship_type', 'interaction'),
-                                                    interaction_count=1,
-                                                    first_observed=relationship.get('first_observed'),
-                                                    last_observed=relationship.get('last_observed'))
+            nodes.append((entity_id, dict(label=label,
+                                          type=entity_info['type'],
+                                          category=category,
+                                          **attributes)))
+        
+        self.political_graph.add_nodes_from(nodes)
+        
+        # Add edges between registered entities
+        registry = self.entity_registry
+        self.political_graph.add_edges_from(
+            (subject_id, object_id, {'weight': weight,
+                                     'relationship_type': relationship_type,
+                                     'interaction_count': interaction_count,
+                                     'first_observed': first_observed,
+                                     'last_observed': last_observed})
+            for subject_id, object_id, weight, interaction_count, relationship_type, first_observed, last_observed
+            in self._edge_agg.values()
+            if subject_id in registry and object_id in registry
+        )
+        self._edge_agg = {}
         
         print(f"  🕸️ Graph built: {len(self.political_graph.nodes)} nodes, {len(self.political_graph.edges)} edges")
     
-    def _generate_time_series_data(self, newsletters_data: List[Dict]) -> None:
-        """Generate time series data points for trend analysis."""
+    def _time_series_cache_path(self) -> Optional[Path]:
+        """Cache file for the time series frame, keyed by the input file fingerprint."""
+        if self.cache_dir is None or self._input_key is None:
+            return None
+        return self.cache_dir / f"timeseries_{self._input_key}.pkl"
+    
+    def _load_cached_time_series(self) -> bool:
+        """Load time_series_df from the cache; False if there is no matching entry."""
+        cache_path = self._time_series_cache_path()
+        if cache_path is None or not cache_path.exists():
+            return False
+        self.time_series_df = pd.read_pickle(cache_path)
+        return True
+    
+    def _generate_time_series_data(self) -> None:
+        """Build the time series frame from the collected columns."""
         print("📈 Generating time series data...")
         
-        self.time_series_data = []
+        if self._time_series_columns is None:
+            print(f"  💾 Loaded {len(self.time_series_df)} cached time series data points")
+            return
         
-        for newsletter in newsletters_data:
-            newsletter_id = newsletter.get('file_name', 'unknown')
-            normalized_results = newsletter.get('database_normalized_results', {})
-            newsletter_date = normalized_results.get('processing_info', {}).get('newsletter_date', '')
-            
-            # Create time series points for people activities
-            for person in normalized_results.get('people', []):
-                # Calculate activity intensity based on mention frequency and context
-                base_intensity = person.get('confidence_average', 0.0)
-                mention_boost = min(person.get('mention_count', 1) / 5.0, 1.0)  # Cap at 1.0
-                activity_intensity = base_intensity * (1 + mention_boost)
-                
-                # Determine activity type based on person's role/category
-                activity_type = self._classify_person_activity_type(person)
-                
-                time_point = TimeSeriesPoint(
-                    date=newsletter_date,
-                    entity_id=person.get('entity_id', ''),
-                    entity_name=person.get('canonical_name', 'Unknown'),
-                    activity_type=activity_type,
-                    activity_intensity=activity_intensity,
-                    context=person.get('newsletter_appearances', [{}])[-1].get('activity', ''),
-                    newsletter_id=newsletter_id
-                )
-                
-                self.time_series_data.append(time_point)
-            
-            # Create time series points for organizational activities
-            for org in normalized_results.get('organizations', []):
-                activity_intensity = org.get('confidence_average', 0.0)
-                
-                time_point = TimeSeriesPoint(
-                    date=newsletter_date,
-                    entity_id=org.get('organization_id', ''),
-                    entity_name=org.get('canonical_name', 'Unknown'),
-                    activity_type='organizational_activity',
-                    activity_intensity=activity_intensity,
-                    context=org.get('newsletter_appearances', [{}])[-1].get('activity', ''),
-                    newsletter_id=newsletter_id
-                )
-                
-                self.time_series_data.append(time_point)
+        # Columns follow TimeSeriesPoint's field order; the repetitive string columns are
+        # stored as categoricals so grouping and date parsing work on the distinct values
+        columns = self._time_series_columns
+        columns['activity_intensity'] = pd.Series(columns['activity_intensity'], dtype=float)
+        self.time_series_df = pd.DataFrame(columns).astype({
+            column: 'category' for column in CATEGORICAL_TIME_SERIES_COLUMNS
+        })
+        self._time_series_columns = None
+        
+        cache_path = self._time_series_cache_path()
+        if cache_path is not None:
+            self.time_series_df.to_pickle(cache_path)
         
-        print(f"  📊 Generated {len(self.time_series_data)} time series data points")
+        print(f"  📊 Generated {len(self.time_series_df)} time series data points")
+    
+    @property
+    def time_series_data(self) -> List[TimeSeriesPoint]:
+        """Time series points materialized from time_series_df, for serialization."""
+        return [TimeSeriesPoint(*row) for row in self.time_series_df.itertuples(index=False, name=None)]
     
     def _classify_person_activity_type(self, person: Dict) -> str:
         """Classify person's activity type for time series analysis."""
-        category = person.get('category', 'unknown')
-        role = person.get('current_role', '').lower()
-        
-        if category == 'political_official':
-            if 'president' in role:
-                return 'executive_activity'
-            elif any(title in role for title in ['senator', 'representative']):
-                return 'legislative_activity'
-            elif any(title in role for title in ['secretary', 'director', 'administrator']):
-                return 'administrative_activity'
-            else:
-                return 'political_activity'
-        elif category == 'journalist':
-            return 'media_activity'
-        elif category in ['staff', 'political_staff']:
-            return 'staff_activity'
-        elif category == 'lobbyist':
-            return 'lobbying_activity'
-        else:
-            return 'general_activity'
+        return _activity_type(person.get('category', 'unknown'), person.get('current_role') or '')
     
     def _analyze_influence_networks(self) -> None:
         """Analyze influence networks and calculate centrality metrics."""
@@ -381,19 +536,20 @@ class TemporalAnalyzer:
             print("  ⚠️ No graph nodes found. Skipping network analysis.")
             return
         
-        # Calculate centrality metrics
-        try:
-            degree_centrality = nx.degree_centrality(self.political_graph)
-            betweenness_centrality = nx.betweenness_centrality(self.political_graph, k=min(100, len(self.political_graph.nodes)))
-            closeness_centrality = nx.closeness_centrality(self.political_graph)
-            eigenvector_centrality = nx.eigenvector_centrality(self.political_graph, max_iter=1000)
-        except Exception as e:
-            print(f"  ⚠️ Error calculating centrality metrics: {e}")
-            # Fallback to degree centrality only
-            degree_centrality = nx.degree_centrality(self.political_graph)
-            betweenness_centrality = {node: 0.0 for node in self.political_graph.nodes}
-            closeness_centrality = {node: 0.0 for node in self.political_graph.nodes}
-            eigenvector_centrality = {node: 0.0 for node in self.political_graph.nodes}
+        # Centralities and communities, reused from disk when the graph is unchanged
+        cache_path = self._network_cache_path() if self.cache_dir is not None else None
+        if cache_path is not None and cache_path.exists():
+            with open(cache_path, 'rb') as f:
+                network_metrics = pickle.load(f)
+            print("  💾 Loaded cached centrality metrics")
+        else:
+            network_metrics = self._compute_network_metrics()
+            if cache_path is not None:
+                with open(cache_path, 'wb') as f:
+                    pickle.dump(network_metrics, f, protocol=pickle.HIGHEST_PROTOCOL)
+        
+        (degree_centrality, betweenness_centrality, closeness_centrality,
+         eigenvector_centrality, communities) = network_metrics
         
         # Update entity influence scores
         for entity_id in self.entity_registry.keys():
@@ -414,23 +570,31 @@ class TemporalAnalyzer:
         
         # Identify key influence networks (communities)
         try:
-            communities = nx.community.greedy_modularity_communities(self.political_graph)
+            # Community subgraphs are sliced from one igraph mirror rather than NetworkX views
+            mirror = None
+            if ig is not None and any(len(community) >= 3 for community in communities):
+                graph, node_ids = self._nx_to_igraph()
+                mirror = (graph, node_ids, {node_id: i for i, node_id in enumerate(node_ids)})
             
             for i, community in enumerate(communities):
                 if len(community) >= 3:  # Only consider communities with 3+ members
-                    # Find central figures in this community
-                    subgraph = self.political_graph.subgraph(community)
-                    sub_centrality = nx.degree_centrality(subgraph)
-                    central_figures = sorted(sub_centrality.items(), key=lambda x: x[1], reverse=True)[:5]
-                    
-                    # Calculate network metrics
-                    network_density = nx.density(subgraph)
-                    clustering_coeff = nx.average_clustering(subgraph)
-                    
-                    try:
-                        avg_path_length = nx.average_shortest_path_length(subgraph) if nx.is_connected(subgraph) else 0.0
-                    except:
-                        avg_path_length = 0.0
+                    if mirror is not None:
+                        (central_figures, network_density,
+                         clustering_coeff, avg_path_length) = self._igraph_community_metrics(community, *mirror)
+                    else:
+                        # Find central figures in this community
+                        subgraph = self.political_graph.subgraph(community)
+                        sub_centrality = nx.degree_centrality(subgraph)
+                        central_figures = sorted(sub_centrality.items(), key=lambda x: x[1], reverse=True)[:5]
+                        
+                        # Calculate network metrics
+                        network_density = nx.density(subgraph)
+                        clustering_coeff = nx.average_clustering(subgraph)
+                        
+                        try:
+                            avg_path_length = nx.average_shortest_path_length(subgraph) if nx.is_connected(subgraph) else 0.0
+                        except:
+                            avg_path_length = 0.0
                     
                     network_name = self._generate_network_name([fig[0] for fig in central_figures[:3]])
                     
@@ -452,6 +616,205 @@ class TemporalAnalyzer:
         
         print(f"  🎯 Identified {len(self.influence_networks)} influence networks")
     
+    def _compute_network_metrics(self) -> Tuple[Dict[str, float], Dict[str, float], Dict[str, float],
+                                                 Dict[str, float], List[List[str]]]:
+        """
+        Degree, betweenness, closeness and eigenvector centrality plus communities.
+        
+        Runs on cuGraph when a GPU is available, then igraph, then plain NetworkX.
+        """
+        mirror = self._nx_to_igraph() if ig is not None and not NX_GPU_BACKEND else None
+        
+        # Calculate centrality metrics
+        try:
+            betweenness_centrality = self._approx_betweenness(mirror=mirror)
+            if mirror is not None:
+                degree_centrality, closeness_centrality, eigenvector_centrality = self._igraph_centrality_metrics(*mirror)
+            else:
+                degree_centrality = nx.degree_centrality(self.political_graph)
+                closeness_centrality = dict.fromkeys(self.political_graph.nodes, 0.0)
+                eigenvector_centrality = dict.fromkeys(self.political_graph.nodes, 0.0)
+                
+                # Isolated entities score zero on both, so only connected nodes are iterated
+                connected = self._connected_subgraph()
+                if len(connected) > 1:
+                    scale = (len(connected) - 1) / (len(self.political_graph) - 1)
+                    for node_id, score in nx.closeness_centrality(connected, **NX_GPU_BACKEND).items():
+                        closeness_centrality[node_id] = score * scale
+                    eigenvector_centrality.update(nx.eigenvector_centrality(connected, max_iter=1000,
+                                                                            **NX_GPU_BACKEND))
+        except Exception as e:
+            print(f"  ⚠️ Error calculating centrality metrics: {e}")
+            # Fallback to degree centrality only
+            degree_centrality = nx.degree_centrality(self.political_graph)
+            betweenness_centrality = {node: 0.0 for node in self.political_graph.nodes}
+            closeness_centrality = {node: 0.0 for node in self.political_graph.nodes}
+            eigenvector_centrality = {node: 0.0 for node in self.political_graph.nodes}
+        
+        # Detect communities
+        try:
+            if mirror is not None:
+                communities = self._igraph_communities(*mirror)
+            else:
+                communities = nx.community.greedy_modularity_communities(self.political_graph, **NX_GPU_BACKEND)
+        except Exception as e:
+            print(f"  ⚠️ Error in community detection: {e}")
+            communities = []
+        
+        return (degree_centrality, betweenness_centrality, closeness_centrality,
+                eigenvector_centrality, [list(community) for community in communities])
+    
+    def _network_cache_path(self) -> Path:
+        """Centrality cache file keyed by backend, nodes and weighted edges."""
+        backend = NX_GPU_BACKEND.get('backend') or ('igraph' if ig is not None else 'networkx')
+        digest = hashlib.blake2b(backend.encode('utf-8'), digest_size=16)
+        digest.update(repr(sorted(self.political_graph.nodes)).encode('utf-8'))
+        edges = sorted((min(u, v), max(u, v), w) for u, v, w in self.political_graph.edges(data='weight'))
+        digest.update(repr(edges).encode('utf-8'))
+        return self.cache_dir / f"centrality_{digest.hexdigest()}.pkl"
+    
+    def _connected_subgraph(self) -> nx.Graph:
+        """
+        Copy of the political graph without isolated entities.
+        
+        Most entities are mentioned without any extracted relationship; they
+        score zero on every centrality except degree, so the expensive
+        routines skip them and rescale to the full graph's normalization.
+        """
+        return self.political_graph.subgraph(
+            node_id for node_id, degree in self.political_graph.degree() if degree > 0
+        ).copy()
+    
+    def _nx_to_igraph(self) -> Tuple['ig.Graph', List[str]]:
+        """Mirror the political graph as an igraph Graph with a parallel node id list."""
+        node_ids = list(self.political_graph.nodes)
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        
+        edges = []
+        weights = []
+        for subject_id, object_id, weight in self.political_graph.edges(data='weight', default=0.0):
+            edges.append((index[subject_id], index[object_id]))
+            weights.append(weight)
+        
+        graph = ig.Graph(n=len(node_ids), edges=edges, directed=False)
+        graph.es['weight'] = weights
+        return graph, node_ids
+    
+    def _approx_betweenness(self, epsilon: float = 0.05, mirror: Optional[Tuple] = None,
+                            seed: int = 42, max_pivots: int = 100) -> Dict[str, float]:
+        """
+        Betweenness centrality estimated from k = min(max_pivots, log2(n) / epsilon^2)
+        random pivots.
+        
+        Only the ranking feeds the influence score, so the sampled estimate is
+        enough; max_pivots keeps the work within the old fixed budget of 100
+        sources, and graphs with no more connected nodes than k get the exact
+        value. Pass the igraph mirror to run the traversals in C instead of NetworkX.
+        """
+        n = len(self.political_graph.nodes)
+        betweenness_centrality = dict.fromkeys(self.political_graph.nodes, 0.0)
+        
+        # Isolated nodes lie on no shortest path and add none as sources, so pivots
+        # are drawn from connected nodes only
+        if mirror is None:
+            connected = self._connected_subgraph()
+            m = len(connected)
+        else:
+            graph, node_ids = mirror
+            members = [i for i, degree in enumerate(graph.degree()) if degree > 0]
+            m = len(members)
+        
+        if m <= 2:
+            return betweenness_centrality
+        k = min(m, max_pivots, int(np.log2(n) / epsilon ** 2))
+        
+        if mirror is None:
+            betweenness = nx.betweenness_centrality(connected, k=k, normalized=False, seed=seed,
+                                                    **NX_GPU_BACKEND)
+            node_ids = list(betweenness)
+            betweenness = np.fromiter(betweenness.values(), dtype=float, count=m)
+        else:
+            graph = graph.induced_subgraph(members)
+            node_ids = [node_ids[i] for i in members]
+            if k < m:
+                pivots = np.random.default_rng(seed).choice(m, size=k, replace=False).tolist()
+                betweenness = np.array(graph.betweenness(sources=pivots), dtype=float) * (m / k)
+            else:
+                betweenness = np.array(graph.betweenness(), dtype=float)
+        
+        # Same normalization as NetworkX for undirected graphs, over all n nodes
+        betweenness *= 2.0 / ((n - 1) * (n - 2))
+        betweenness_centrality.update(zip(node_ids, betweenness.tolist()))
+        return betweenness_centrality
+    
+    def _igraph_centrality_metrics(self, graph: 'ig.Graph', node_ids: List[str]) -> Tuple[Dict[str, float], ...]:
+        """
+        Degree, closeness and eigenvector centrality via igraph.
+        
+        Scores are rescaled to NetworkX's normalization so influence scores
+        stay comparable with the pure NetworkX path.
+        """
+        n = len(node_ids)
+        if n == 1:
+            return {node_ids[0]: 1.0}, {node_ids[0]: 0.0}, {node_ids[0]: 1.0}
+        
+        degree = np.array(graph.degree(), dtype=float)
+        closeness = np.zeros(n)
+        eigenvector = np.zeros(n)
+        
+        # Isolated nodes score zero on both, so they are left out of the traversals
+        members = np.flatnonzero(degree > 0)
+        if len(members) > 1:
+            connected = graph.induced_subgraph(members.tolist())
+            
+            # NetworkX scales closeness by the reachable fraction of the graph
+            components = connected.connected_components()
+            reachable = np.array(components.sizes(), dtype=float)[components.membership] - 1
+            closeness[members] = np.nan_to_num(np.array(connected.closeness(normalized=True), dtype=float))
+            closeness[members] *= reachable / (n - 1)
+            
+            with warnings.catch_warnings():
+                # igraph warns on disconnected graphs
+                warnings.simplefilter('ignore', RuntimeWarning)
+                eigenvector[members] = connected.eigenvector_centrality()
+            norm = np.linalg.norm(eigenvector)
+            if norm > 0:
+                eigenvector /= norm
+        
+        degree /= n - 1
+        
+        return tuple(
+            dict(zip(node_ids, scores.tolist()))
+            for scores in (degree, closeness, eigenvector)
+        )
+    
+    def _igraph_community_metrics(self, community: List[str], graph: 'ig.Graph', node_ids: List[str],
+                                  node_index: Dict[str, int]) -> Tuple[List[Tuple[str, float]], float, float, float]:
+        """
+        Top central figures, density, average clustering and average path length of a community.
+        
+        Matches the NetworkX definitions; the induced subgraph keeps the mirror's
+        vertex order, so degree ties are broken by graph insertion order.
+        """
+        members = sorted(node_index[node_id] for node_id in community)
+        subgraph = graph.induced_subgraph(members)
+        n = subgraph.vcount()
+        
+        sub_centrality = [degree / (n - 1) for degree in subgraph.degree()]
+        central_figures = sorted(zip((node_ids[i] for i in members), sub_centrality),
+                                 key=lambda x: x[1], reverse=True)[:5]
+        
+        clustering = subgraph.transitivity_local_undirected(mode='zero')
+        avg_path_length = subgraph.average_path_length() if subgraph.is_connected() else 0.0
+        
+        return central_figures, subgraph.density(), sum(clustering) / n, avg_path_length
+    
+    def _igraph_communities(self, graph: 'ig.Graph', node_ids: List[str]) -> List[Set[str]]:
+        """Louvain communities on the weighted graph, largest first."""
+        clusters = graph.community_multilevel(weights='weight')
+        communities = [{node_ids[i] for i in members} for members in clusters]
+        return sorted(communities, key=len, reverse=True)
+    
     def _generate_network_name(self, central_figures: List[str]) -> str:
         """Generate descriptive name for influence network."""
         if not central_figures:
@@ -479,45 +842,52 @@ class TemporalAnalyzer:
         """Identify political trends from time series data."""
         print("📊 Identifying political trends...")
         
-        if not self.time_series_data:
+        if self.time_series_df.empty:
             print("  ⚠️ No time series data available. Skipping trend analysis.")
             return
         
-        # Convert to DataFrame for easier analysis
-        df_data = []
-        for point in self.time_series_data:
-            df_data.append({
-                'date': point.date,
-                'entity_id': point.entity_id,
-                'entity_name': point.entity_name,
-                'activity_type': point.activity_type,
-                'activity_intensity': point.activity_intensity,
-                'context': point.context,
-                'newsletter_id': point.newsletter_id
-            })
-        
-        df = pd.DataFrame(df_data)
-        
-        # Ensure date column is datetime
+        # Dates stay ISO strings in time_series_df for export; parse a working copy as
+        # whole seconds, which is the resolution the ISO output carries
         try:
-            df['date'] = pd.to_datetime(df['date'])
+            dates = pd.to_datetime(self.time_series_df['date'], cache=True).to_numpy().astype('datetime64[s]')
         except Exception as e:
             print(f"  ⚠️ Error parsing dates: {e}")
             return
         
-        # Group by entity and analyze trends
-        for entity_id in df['entity_id'].unique():
-            entity_data = df[df['entity_id'] == entity_id].copy()
-            
-            if len(entity_data) < 2:  # Need at least 2 points for trend analysis
-                continue
-            
-            entity_data = entity_data.sort_values('date')
-            entity_name = entity_data['entity_name'].iloc[0]
-            
-            # Calculate trend metrics
-            activity_values = entity_data['activity_intensity'].values
-            trend_slope = np.polyfit(range(len(activity_values)), activity_values, 1)[0]
+        # Order rows by entity (first appearance) and date with one integer lexsort, so each
+        # entity is one contiguous run; NaT gets the largest key so it sorts last
+        entity_order = pd.factorize(self.time_series_df['entity_id'])[0]
+        date_keys = np.where(np.isnat(dates), np.iinfo(np.int64).max, dates.view(np.int64))
+        rows = np.flatnonzero(entity_order >= 0)
+        rows = rows[np.lexsort((date_keys[rows], entity_order[rows]))]
+        
+        order = entity_order[rows]
+        dates = dates[rows]
+        starts = np.flatnonzero(np.r_[True, order[1:] != order[:-1]]) if len(order) else order
+        values = self.time_series_df['activity_intensity'].to_numpy(dtype=float)[rows]
+        slopes, peak_rows, peak_values = _fit_segment_trends(starts, values)
+        strengths = np.abs(slopes) * peak_values
+        
+        # Each run's valid dates lead it
+        counts = np.diff(np.append(starts, len(order)))
+        valid_dates = np.add.reduceat(~np.isnat(dates), starts) if len(starts) else counts
+        last_rows = starts + np.maximum(valid_dates, 1) - 1
+        
+        # Need at least 2 points for trend analysis; only include significant trends
+        significant = np.flatnonzero((counts >= 2) & (strengths > 0.5))  # Minimum threshold
+        first_rows = rows[starts[significant]]
+        entity_ids = self.time_series_df['entity_id'].to_numpy()[first_rows]
+        entity_names = self.time_series_df['entity_name'].to_numpy()[first_rows]
+        
+        # ISO strings for just the reported dates, formatted in one vectorized call each
+        start_dates = np.datetime_as_string(dates[starts[significant]], unit='s')
+        end_dates = np.datetime_as_string(dates[last_rows[significant]], unit='s')
+        peak_dates = np.datetime_as_string(dates[peak_rows[significant]], unit='s')
+        
+        for j, i in enumerate(significant):
+            trend_slope = slopes[i]
+            entity_id = entity_ids[j]
+            entity_name = entity_names[j]
             
             # Identify trend type
             if abs(trend_slope) < 0.1:
@@ -527,25 +897,18 @@ class TemporalAnalyzer:
             else:
                 trend_type = 'declining_activity'
             
-            # Find peak activity
-            peak_idx = np.argmax(activity_values)
-            peak_date = entity_data.iloc[peak_idx]['date'].isoformat()
-            
             trend = PoliticalTrend(
                 trend_id=f"trend_{entity_id}",
                 trend_name=f"{entity_name} - {trend_type.replace('_', ' ').title()}",
-                start_date=entity_data['date'].min().isoformat(),
-                end_date=entity_data['date'].max().isoformat(),
-                peak_date=peak_date,
-                trend_strength=abs(trend_slope) * np.max(activity_values),
+                start_date=str(start_dates[j]),
+                end_date=str(end_dates[j]),
+                peak_date=str(peak_dates[j]),
+                trend_strength=strengths[i],
                 key_entities=[entity_id],
                 description=self._generate_trend_description(entity_name, trend_type, trend_slope),
                 trend_category=trend_type
             )
-            
-            # Only include significant trends
-            if trend.trend_strength > 0.5:  # Minimum threshold
-                self.political_trends[trend.trend_id] = trend
+            self.political_trends[trend.trend_id] = trend
         
         print(f"  📈 Identified {len(self.political_trends)} significant political trends")
     
@@ -559,7 +922,12 @@ class TemporalAnalyzer:
             return f"{entity_name} maintains stable political activity levels over the analyzed period (slope: {slope:.3f})"
     
     def _compile_analysis_results(self) -> Dict:
-        """Compile comprehensive analysis results."""
+        """
+        Compile comprehensive analysis results.
+        
+        Dataclasses are flattened with vars() rather than asdict(), which deep-copies
+        every nested value; the results are only read for export.
+        """
         # Convert graph to serializable format
         graph_nodes = []
         for node_id, data in self.political_graph.nodes(data=True):
@@ -570,15 +938,15 @@ class TemporalAnalyzer:
                 node_type=data.get('type', 'unknown'),
                 label=data.get('label', 'Unknown'),
                 category=data.get('category', 'unknown'),
-                attributes=data,
+                attributes=dict(data),
                 first_appeared=entity_info.get('data', {}).get('first_mentioned', ''),
                 last_appeared=entity_info.get('data', {}).get('last_mentioned', ''),
-                activity_score=len(entity_info.get('activity_dates', [])),
+                activity_score=entity_info.get('appearance_count', 0),
                 influence_score=entity_info.get('influence_score', 0.0),
                 centrality_metrics=entity_info.get('centrality_metrics', {})
             )
             
-            graph_nodes.append(asdict(graph_node))
+            graph_nodes.append(vars(graph_node))
         
         # Convert graph edges
         graph_edges = []
@@ -595,7 +963,7 @@ class TemporalAnalyzer:
                 temporal_pattern='stable'  # TODO: Analyze temporal patterns
             )
             
-            graph_edges.append(asdict(graph_edge))
+            graph_edges.append(vars(graph_edge))
         
         # Compile final results
         analysis_results = {
@@ -614,9 +982,9 @@ class TemporalAnalyzer:
                     'connected_components': nx.number_connected_components(self.political_graph)
                 }
             },
-            'time_series_data': [asdict(point) for point in self.time_series_data],
-            'political_trends': {trend_id: asdict(trend) for trend_id, trend in self.political_trends.items()},
-            'influence_networks': {net_id: asdict(network) for net_id, network in self.influence_networks.items()},
+            'time_series_data': self.time_series_df.to_dict('records'),
+            'political_trends': {trend_id: vars(trend) for trend_id, trend in self.political_trends.items()},
+            'influence_networks': {net_id: vars(network) for net_id, network in self.influence_networks.items()},
             'entity_registry': self._serialize_entity_registry()
         }
         
@@ -632,10 +1000,10 @@ class TemporalAnalyzer:
                 'influence_score': entity_info.get('influence_score', 0.0),
                 'centrality_metrics': entity_info.get('centrality_metrics', {}),
                 'activity_summary': {
-                    'total_appearances': len(entity_info.get('activity_dates', [])),
+                    'total_appearances': entity_info.get('appearance_count', 0),
                     'active_date_range': {
-                        'start': min(entity_info.get('activity_dates', []), default=''),
-                        'end': max(entity_info.get('activity_dates', []), default='')
+                        'start': entity_info.get('first_date', ''),
+                        'end': entity_info.get('last_date', '')
                     }
                 }
             }
@@ -647,57 +1015,165 @@ class TemporalAnalyzer:
         output_dir = Path(output_dir)
         output_dir.mkdir(exist_ok=True)
         
-        files_created = {}
-        
-        # Export complete analysis results
-        complete_file = output_dir / "temporal_analysis_complete.json"
-        with open(complete_file, 'w', encoding='utf-8') as f:
-            json.dump(analysis_results, f, indent=2, ensure_ascii=False)
-        files_created['complete_analysis'] = str(complete_file)
+        # Output paths, keyed as in the returned mapping of created files
+        paths = {
+            'graph_data': output_dir / "political_network_graph.json",
+            'complete_analysis': output_dir / "temporal_analysis_complete.json",
+            'time_series_csv': output_dir / "political_time_series.csv",
+            'trends': output_dir / "political_trends.json",
+            'influence_networks': output_dir / "influence_networks.json",
+        }
         
         # Export graph data for visualization (Gephi/Cytoscape format)
-        graph_file = output_dir / "political_network_graph.json"
         graph_data = {
             'nodes': analysis_results['graph_data']['nodes'],
             'edges': analysis_results['graph_data']['edges']
         }
-        with open(graph_file, 'w', encoding='utf-8') as f:
-            json.dump(graph_data, f, indent=2, ensure_ascii=False)
-        files_created['graph_data'] = str(graph_file)
         
-        # Export time series data as CSV
-        time_series_file = output_dir / "political_time_series.csv"
-        time_series_df = pd.DataFrame(analysis_results['time_series_data'])
-        time_series_df.to_csv(time_series_file, index=False)
-        files_created['time_series_csv'] = str(time_series_file)
+        # Both documents are written member by member; nodes and edges are streamed
+        # item by item into both files, each item encoded once, and the complete
+        # analysis's other members are encoded whole around them
+        graph_extras = [(key, value) for key, value in analysis_results['graph_data'].items()
+                        if key not in graph_data]
+        
+        with open(paths['graph_data'], 'wb', buffering=EXPORT_BUFFER_SIZE) as graph_out, \
+                open(paths['complete_analysis'], 'wb', buffering=EXPORT_BUFFER_SIZE) as complete_out:
+            graph_out.write(b'{\n')
+            complete_out.write(b'{\n')
+            for position, (key, value) in enumerate(analysis_results.items()):
+                complete_out.write(b',\n' if position else b'')
+                if key != 'graph_data':
+                    complete_out.write(_encode_json_member(key, value, 2))
+                    continue
+                
+                complete_out.write(b'  ' + encode_json(key) + b': {\n')
+                _stream_json_members([(graph_out, 2), (complete_out, 4)], graph_data)
+                for extra_key, extra_value in graph_extras:
+                    complete_out.write(b',\n' + _encode_json_member(extra_key, extra_value, 4))
+                complete_out.write(b'\n  }')
+            graph_out.write(b'\n}')
+            complete_out.write(b'\n}')
+        
+        # Export time series data as CSV, straight from the records rather than a DataFrame
+        rows = analysis_results['time_series_data']
+        fieldnames = list(rows[0]) if rows else [field.name for field in fields(TimeSeriesPoint)]
+        with open(paths['time_series_csv'], 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(fieldnames)
+            # Records share the frame's column order, so their values are written
+            # positionally; missing values (NaN) become empty fields, as pandas does
+            writer.writerows(['' if value != value else value for value in row.values()] for row in rows)
         
         # Export trends summary
-        trends_file = output_dir / "political_trends.json"
-        with open(trends_file, 'w', encoding='utf-8') as f:
-            json.dump(analysis_results['political_trends'], f, indent=2, ensure_ascii=False)
-        files_created['trends'] = str(trends_file)
+        write_json(paths['trends'], analysis_results['political_trends'])
         
         # Export influence networks
-        networks_file = output_dir / "influence_networks.json"
-        with open(networks_file, 'w', encoding='utf-8') as f:
-            json.dump(analysis_results['influence_networks'], f, indent=2, ensure_ascii=False)
-        files_created['influence_networks'] = str(networks_file)
+        write_json(paths['influence_networks'], analysis_results['influence_networks'])
+        
+        return {key: os.fspath(path) for key, path in paths.items()}
+
+
+def _fit_segment_trends(starts: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Least-squares slope, peak row and peak value for each contiguous run of values.
+    
+    Run i covers values[starts[i]:starts[i + 1]] and is fitted against x = 0..n-1.
+    Everything is reduced with ufunc.reduceat, so there is no per-run Python work.
+    """
+    if len(values) == 0:
+        return np.empty(0), np.empty(0, dtype=int), np.empty(0)
+    
+    counts = np.diff(np.append(starts, len(values)))
+    rows = np.arange(len(values))
+    
+    # slope = cov(x, y) / var(x); centring x makes the y mean drop out, and
+    # sum((x - x_mean)^2) = n(n^2 - 1)/12 for x = 0..n-1
+    n = counts.astype(float)
+    x = rows - np.repeat(starts + (n - 1) / 2, counts)
+    with np.errstate(divide='ignore', invalid='ignore'):  # single-point runs have no slope
+        slopes = np.add.reduceat(x * values, starts) / (n * (n * n - 1) / 12)
+    
+    # First row reaching the run's maximum, as np.argmax would pick
+    peak_values = np.maximum.reduceat(values, starts)
+    is_peak = values == np.repeat(peak_values, counts)
+    peak_rows = np.minimum.reduceat(np.where(is_peak, rows, len(values)), starts)
+    
+    return slopes, peak_rows, peak_values
+
+
+def encode_json(data: Any) -> bytes:
+    """Encode data as indented UTF-8 JSON, with orjson when available."""
+    if orjson is not None:
+        # Non-string keys are coerced to strings, as the stdlib encoder does
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Write data as indented UTF-8 JSON using a single write."""
+    with open(path, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+        f.write(encode_json(data))
+
+
+def _encode_json_member(key: str, value: Any, indent: int) -> bytes:
+    """One '"key": value' object member as encode_json lays it out at that indent."""
+    prefix = b'\n' + b' ' * indent
+    return b' ' * indent + encode_json(key) + b': ' + encode_json(value).replace(b'\n', prefix)
+
+
+def _stream_json_members(outputs: List[Tuple[BinaryIO, int]], sections: Dict[str, List]) -> None:
+    """
+    Write '"key": [items]' object members to several outputs, encoding each item once.
+    
+    Args:
+        outputs: (binary file, indent of the member lines) pairs
+        sections: Member name -> list of JSON-serializable items
+        
+    Output matches encode_json for the same members at that nesting depth. JSON
+    escapes newlines inside strings, so re-indenting only touches structural ones.
+    """
+    for position, (key, items) in enumerate(sections.items()):
+        for out, indent in outputs:
+            out.write(b',\n' if position else b'')
+            out.write(b' ' * indent + encode_json(key) + b': [')
+        
+        for index, item in enumerate(items):
+            encoded = encode_json(item)
+            for out, indent in outputs:
+                prefix = b'\n' + b' ' * (indent + 2)
+                out.write((b',' if index else b'') + prefix + encoded.replace(b'\n', prefix))
         
-        return files_created
+        for out, indent in outputs:
+            out.write(b'\n' + b' ' * indent + b']' if items else b']')
+
+
+def _load_normalized_newsletter(file_path: Path) -> Optional[NewsletterView]:
+    """Read one Stage 3 file into a view; None if it fails to parse or has no normalized results."""
+    try:
+        data = file_path.read_bytes()
+        newsletter = orjson.loads(data) if orjson is not None else json.loads(data)
+    except Exception as e:
+        print(f"⚠️ Error loading {file_path}: {e}")
+        return None
+    if 'database_normalized_results' not in newsletter:
+        return None
+    return NewsletterView.from_newsletter(newsletter)
 
 
-def analyze_political_newsletters_stage4(input_dir: Path, output_dir: Path) -> Dict:
+def analyze_political_newsletters_stage4(input_dir: Path, output_dir: Path,
+                                         cache_dir: Optional[Path] = None) -> Dict:
     """
     Run Stage 4 temporal analysis on normalized newsletter data.
     
     Args:
         input_dir: Directory containing Stage 3 normalized newsletters
         output_dir: Directory to save Stage 4 analysis results
+        cache_dir: Optional directory for memoized centralities and time series
         
     Returns:
         Complete temporal analysis results
     """
-    analyzer = TemporalAnalyzer()
+    analyzer = TemporalAnalyzer(cache_dir=cache_dir)
     
     print(f"📈 Stage 4: Political Newsletter Temporal Analysis")
     print("=" * 55)
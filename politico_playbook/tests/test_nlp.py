@@ -5,8 +5,9 @@ Test script for NLP processor on collected newsletter data.
 
 import json
 import os
+from collections import Counter
 from pathlib import Path
-from src.processing.nlp_processor import NewsletterNLPProcessor
+from src.processing.nlp_processor import NewsletterNLPProcessor, process_corpus
 
 
 def test_nlp_on_sample_newsletter():
@@ -79,18 +80,24 @@ def test_nlp_on_sample_newsletter():
     output_file = data_dir / "nlp_enhanced" / f"{sample_file.stem}_nlp.json"
     os.makedirs(output_file.parent, exist_ok=True)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(processed_data, f, indent=2, ensure_ascii=False)
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(json.dumps(processed_data, indent=2, ensure_ascii=False))
     
     print(f"\n✅ Enhanced newsletter saved to: {output_file}")
     
     return processed_data
 
 
+def _load_newsletters(json_files):
+    """Yield newsletter dictionaries from JSON files, one at a time."""
+    for json_file in json_files:
+        with open(json_file, 'r', encoding='utf-8') as f:
+            yield json.load(f)
+
+
 def test_multiple_newsletters():
     """Test NLP processor on multiple newsletters."""
     
-    processor = NewsletterNLPProcessor()
     data_dir = Path(__file__).parent / "data" / "structured"
     
     # Process first 3 newsletters
@@ -98,16 +105,12 @@ def test_multiple_newsletters():
     
     print(f"\n🔄 Processing {len(json_files)} newsletters...")
     
-    all_results = []
+    # One newsletter per task, spread over worker processes that each load the model once
+    workers = max(1, min(os.cpu_count() or 1, len(json_files)))
+    all_results = list(process_corpus(_load_newsletters(json_files), workers=workers, batch_size=1))
     
-    for json_file in json_files:
-        print(f"\nProcessing: {json_file.name}")
-        
-        with open(json_file, 'r', encoding='utf-8') as f:
-            newsletter_data = json.load(f)
-        
-        processed_data = processor.process_newsletter(newsletter_data)
-        all_results.append(processed_data)
+    for json_file, processed_data in zip(json_files, all_results):
+        print(f"\nProcessed: {json_file.name}")
         
         # Quick summary
         nlp_results = processed_data.get('nlp_results', {})
@@ -121,7 +124,12 @@ def test_multiple_newsletters():
     # Aggregate analysis
     print(f"\n📈 AGGREGATE ANALYSIS:")
     
-    all_persons = set()
+    # Mentions per person; its keys double as the set of unique persons
+    person_counts = Counter(
+        person['name']
+        for result in all_results
+        for person in result.get('nlp_results', {}).get('entities', {}).get('persons', [])
+    )
     all_orgs = set()
     all_relationships = []
     
@@ -129,29 +137,17 @@ def test_multiple_newsletters():
         nlp_results = result.get('nlp_results', {})
         entities = nlp_results.get('entities', {})
         
-        for person in entities.get('persons', []):
-            all_persons.add(person['name'])
-        
         for org in entities.get('organizations', []):
             all_orgs.add(org['name'])
         
         all_relationships.extend(nlp_results.get('relationships', []))
     
-    print(f"  Total unique persons: {len(all_persons)}")
+    print(f"  Total unique persons: {len(person_counts)}")
     print(f"  Total unique organizations: {len(all_orgs)}")
     print(f"  Total relationships: {len(all_relationships)}")
     
-    # Most mentioned persons
-    person_counts = {}
-    for result in all_results:
-        nlp_results = result.get('nlp_results', {})
-        entities = nlp_results.get('entities', {})
-        for person in entities.get('persons', []):
-            name = person['name']
-            person_counts[name] = person_counts.get(name, 0) + 1
-    
     print(f"\n👑 Most mentioned persons:")
-    for name, count in sorted(person_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
+    for name, count in person_counts.most_common(5):
         print(f"  - {name}: {count} mentions")
 
 